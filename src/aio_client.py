@@ -3,16 +3,36 @@ Adafruit IO client with MQTT and REST API support
 """
 
 import logging
+import math
 import time
+from datetime import datetime, timedelta, time as dt_time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Optional, Callable
 from threading import Thread, Event
+from queue import Queue, Full
+from collections import deque
 import paho.mqtt.client as mqtt
 
+try:
+    import orjson
+    _loads = orjson.loads  # Rust parser, accepts bytes directly
+except ImportError:
+    import json
+    _loads = json.loads
+
 
 class AIOClient:
     """Adafruit IO client with MQTT and REST fallback"""
 
+    MAX_REST_BACKOFF = 60.0  # Upper bound (seconds) for error backoff
+    MESSAGE_QUEUE_SIZE = 32  # Pending MQTT payloads before new ones are dropped
+    COMMAND_GAP_HISTORY = 32  # Recent command inter-arrival gaps kept for poll scheduling
+
+    # Preset payloads mapped straight to their command strings (no decode needed)
+    PRESET_PAYLOADS = {p: p.decode('ascii') for p in (b"ON-CALL", b"FREE", b"BUSY", b"QUIET", b"KNOCK")}
+
     def __init__(self, config, on_message_callback: Optional[Callable] = None):
         """
         Initialize Adafruit IO client
@@ -29,15 +49,57 @@ class AIOClient:
         self.mqtt_connected = False
         self.mqtt_enabled = config.mqtt_enabled
 
+        # Topics built once and replayed on every (re)connect
+        self._feed_topic = f"{config.aio_username}/feeds/{config.aio_feed}"
+        self._subscriptions = [(self._feed_topic, 0)]
+
         # REST state
         self.rest_enabled = config.rest_enabled
         self.last_rest_poll = 0
         self.last_command = None
+        self._backoff = config.rest_poll_interval  # Current poll interval (grows on errors)
+        self._err_streak = 0
+
+        # Adaptive poll budget (only used when rest_daily_budget > 0)
+        self._budget_day = None
+        self._polls_today = 0
+        self._last_command_time = None
+        self._last_noted_command = None  # Last command seen by either transport
+        self._command_gaps = deque(maxlen=self.COMMAND_GAP_HISTORY)
+
+        # Conditional GET validators from the last 200 response
+        self._etag = None
+        self._last_modified = None
+
+        # Persistent HTTP session (keep-alive avoids a TCP+TLS handshake per poll)
+        self.http = requests.Session()
+        self.http.headers.update({"X-AIO-KEY": self.config.aio_key})
+
+        # Small pool (single poller); one quick reconnect for a dropped keep-alive
+        # connection only - polls run on the main loop, so server errors and
+        # outages are left to the app-level backoff instead of retried here
+        retry = Retry(total=1, connect=1, read=0, status=0, allowed_methods=frozenset(["GET"]))
+        self.http.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=retry))
+
+        # URL and headers never change, so prepare the poll request once and resend it
+        # With a group configured, one request returns the last value of every feed in it
+        self._group = config.aio_group
+        if self._group:
+            url = f"https://io.adafruit.com/api/v2/{config.aio_username}/groups/{self._group}"
+            self._command_feed_keys = {config.aio_feed, f"{self._group}.{config.aio_feed}"}
+        else:
+            url = f"https://io.adafruit.com/api/v2/{config.aio_username}/feeds/{config.aio_feed}/data/last"
+        self._rest_request = self.http.prepare_request(requests.Request("GET", url))
 
         # Control
         self.running = False
         self.stop_event = Event()
 
+        # MQTT payloads are handed off to a worker so callbacks (display
+        # rendering) never block paho's network thread
+        self._message_queue = Queue(maxsize=self.MESSAGE_QUEUE_SIZE)
+        self._worker_thread = None
+
         # Initialize MQTT if enabled
         if self.mqtt_enabled:
             self._init_mqtt()
@@ -56,7 +118,9 @@ class AIOClient:
             # Set callbacks
             self.mqtt_client.on_connect = self._on_connect
             self.mqtt_client.on_disconnect = self._on_disconnect
-            self.mqtt_client.on_message = self._on_mqtt_message
+
+            # Per-topic handler so other feeds can share this connection
+            self.mqtt_client.message_callback_add(self._feed_topic, self._on_mqtt_message)
 
             # Connect
             broker = self.config.data['aio'].get('mqtt', {}).get('broker', 'io.adafruit.com')
@@ -79,10 +143,9 @@ class AIOClient:
             self.mqtt_connected = True
             logging.info("Connected to Adafruit IO MQTT")
 
-            # Subscribe to command feed
-            feed_topic = f"{self.config.aio_username}/feeds/{self.config.aio_feed}"
-            client.subscribe(feed_topic)
-            logging.info(f"Subscribed to {feed_topic}")
+            # Subscribe to all topics in a single SUBSCRIBE packet
+            client.subscribe(self._subscriptions)
+            logging.info(f"Subscribed to {', '.join(topic for topic, _ in self._subscriptions)}")
 
         else:
             self.mqtt_connected = False
@@ -97,17 +160,32 @@ class AIOClient:
             logging.info("MQTT disconnected")
 
     def _on_mqtt_message(self, client, userdata, msg):
-        """MQTT message callback"""
+        """MQTT message callback (paho network thread - enqueue only)"""
         try:
-            payload = msg.payload.decode('utf-8')
-            logging.debug(f"MQTT message received: {payload}")
+            self._message_queue.put_nowait(msg.payload)
+        except Full:
+            logging.warning("MQTT message queue full, dropping message")
 
-            # Parse message
-            if self.on_message_callback:
-                self.on_message_callback({'value': payload, 'source': 'mqtt'})
+    def _process_messages(self):
+        """Worker thread: decode queued MQTT payloads and dispatch callbacks"""
+        while True:
+            payload = self._message_queue.get()
+            if payload is None:
+                break
 
-        except Exception as e:
-            logging.error(f"Error processing MQTT message: {e}")
+            try:
+                command = self.PRESET_PAYLOADS.get(payload)
+                payload = command if command is not None else payload.decode('utf-8')
+                logging.debug("MQTT message received: %s", payload)
+
+                self._note_command(payload, time.time())
+
+                # Parse message
+                if self.on_message_callback:
+                    self.on_message_callback({'value': payload, 'source': 'mqtt'})
+
+            except Exception as e:
+                logging.error(f"Error processing MQTT message: {e}")
 
     def poll_rest_api(self) -> Optional[dict]:
         """
@@ -116,44 +194,166 @@ class AIOClient:
         Returns:
             Dictionary with 'value' key, or None if no new data
         """
-        if not self.rest_enabled:
+        if not self.rest_enabled or self.mqtt_connected:
             return None
 
-        # Check poll interval
+        # Check poll interval (backs off exponentially after errors)
         now = time.time()
-        if now - self.last_rest_poll < self.config.rest_poll_interval:
+        if now - self.last_rest_poll < self._backoff:
             return None
 
         self.last_rest_poll = now
+        self._roll_budget_day(datetime.now())
+        self._polls_today += 1
 
         try:
-            url = f"https://io.adafruit.com/api/v2/{self.config.aio_username}/feeds/{self.config.aio_feed}/data/last"
-            headers = {"X-AIO-KEY": self.config.aio_key}
+            # Let the server answer 304 (empty body) when nothing changed
+            headers = self._rest_request.headers
+            for name, value in (("If-None-Match", self._etag), ("If-Modified-Since", self._last_modified)):
+                if value:
+                    headers[name] = value
+                else:
+                    headers.pop(name, None)
 
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self.http.send(self._rest_request, timeout=10)
+
+            if response.status_code == 304:
+                self._reset_backoff()
+                return None
 
             if response.status_code == 200:
-                data = response.json()
-                command = data.get('value', '')
+                self._reset_backoff()
+                self._etag = response.headers.get("ETag")
+                self._last_modified = response.headers.get("Last-Modified")
+                data = _loads(response.content)
+                command = self._extract_command(data)
 
                 # Only return if different from last command
                 if command != self.last_command:
                     self.last_command = command
-                    logging.debug(f"REST API: New command '{command}'")
+                    self._note_command(command, now)
+                    logging.debug("REST API: New command '%s'", command)
                     return {'value': command, 'source': 'rest'}
                 else:
                     return None
             else:
                 logging.warning(f"REST API returned status {response.status_code}")
+                self._increase_backoff()
                 return None
 
         except Exception as e:
             logging.error(f"REST API poll error: {e}")
+            self._increase_backoff()
             return None
 
+    def _extract_command(self, data: dict) -> str:
+        """
+        Get the command value from a REST response
+
+        Args:
+            data: Parsed feed data/last response, or group response when polling a group
+
+        Returns:
+            Command string ('' if the command feed has no value)
+        """
+        if not self._group:
+            return data.get('value', '')
+
+        for feed in data.get('feeds', []):
+            if feed.get('key') in self._command_feed_keys:
+                return feed.get('last_value') or ''
+        return ''
+
+    def _increase_backoff(self):
+        """Double the REST poll interval after a failed poll (capped, never below the normal schedule)"""
+        self._err_streak += 1
+        self._backoff = max(self._next_poll_delay(), min(self._backoff * 2, self.MAX_REST_BACKOFF))
+        logging.debug("REST API backoff: %.0fs after %d error(s)", self._backoff, self._err_streak)
+
+    def _reset_backoff(self):
+        """Restore the normal REST poll interval after a successful poll"""
+        self._backoff = self._next_poll_delay()
+        self._err_streak = 0
+
+    def _note_command(self, command: str, now: float):
+        """
+        Record a command arrival (MQTT or REST) for the poll scheduler.
+
+        Repeats of the current command (e.g. retained MQTT re-deliveries after
+        a reconnect) are ignored so they don't add near-zero gaps.
+        """
+        if command == self._last_noted_command:
+            return
+        self._last_noted_command = command
+
+        if self._last_command_time is not None:
+            self._command_gaps.append(now - self._last_command_time)
+        self._last_command_time = now
+
+    def _burst_window(self, default: float) -> float:
+        """
+        Seconds after a command during which polls are pulled in.
+
+        Uses the 90th percentile of recent command inter-arrival gaps, so the
+        dense-polling window follows how commands have actually been arriving.
+        Falls back to default until a few gaps have been seen.
+        """
+        if len(self._command_gaps) < 4:
+            return default
+        gaps = sorted(self._command_gaps)
+        return gaps[int(0.9 * (len(gaps) - 1))]
+
+    def _roll_budget_day(self, now: datetime):
+        """Reset the daily poll count when the date changes"""
+        if self._budget_day != now.date():
+            self._budget_day = now.date()
+            self._polls_today = 0
+
+    def _next_poll_delay(self) -> float:
+        """
+        Compute delay until next REST poll.
+
+        With a daily budget configured, polls are spread over the time left
+        until midnight: the next poll is placed at U * (1 - exp(-1/k)) for
+        U seconds remaining and k polls left, then pulled in while the last
+        command is recent (commands tend to arrive in bursts). "Recent" is
+        learned from the gaps between past commands (see _burst_window).
+        The budget is a hard cap: once it is spent, the next poll waits
+        until midnight. Never polls faster than the configured poll_interval.
+        """
+        interval = self.config.rest_poll_interval
+        budget = self.config.rest_daily_budget
+        if budget <= 0:
+            return interval
+
+        now = datetime.now()
+        self._roll_budget_day(now)
+
+        midnight = datetime.combine(now.date() + timedelta(days=1), dt_time())
+        remaining_seconds = (midnight - now).total_seconds()
+        remaining_polls = budget - self._polls_today
+        if remaining_polls <= 0:
+            # Budget spent: hold until the count resets at midnight
+            return max(interval, remaining_seconds)
+
+        delay = remaining_seconds * (1 - math.exp(-1 / remaining_polls))
+
+        # Shift toward recency: poll denser shortly after a command
+        if self._last_command_time is not None:
+            age = time.time() - self._last_command_time
+            window = self._burst_window(delay)
+            if age < window:
+                delay *= max(0.25, age / window)
+
+        return max(interval, delay)
+
     def start(self):
         """Start the client"""
         self.running = True
+
+        self._worker_thread = Thread(target=self._process_messages, daemon=True)
+        self._worker_thread.start()
+
         logging.info("AIO Client started")
 
     def stop(self):
@@ -165,6 +365,16 @@ class AIOClient:
             self.mqtt_client.loop_stop()
             self.mqtt_client.disconnect()
 
+        if self._worker_thread:
+            try:
+                self._message_queue.put_nowait(None)  # Sentinel: stop worker
+                self._worker_thread.join(timeout=2)
+            except Full:
+                # Worker is stuck behind a full queue; it's a daemon, let it exit with the process
+                logging.warning("MQTT message queue full, not waiting for worker")
+
+        self.http.close()
+
         logging.info("AIO Client stopped")
 
     def is_connected(self) -> bool:
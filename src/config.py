@@ -3,12 +3,19 @@ Configuration management and color palettes
 """
 
 import os
+import time
 import yaml
 import logging
-from datetime import datetime, time as dt_time
+from datetime import datetime, timezone, time as dt_time
 from pathlib import Path
 from functools import cached_property
 
+# Prefer libyaml's C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 try:
     from astral import LocationInfo
     from astral.sun import sun
@@ -18,14 +25,47 @@ except ImportError:
     logging.warning("astral library not available - sunrise/sunset calculation disabled")
 
 
+def _compute_temp_color(t: int) -> int:
+    """Palette color index for a temperature in °F (blue cold -> red hot)"""
+    if t <= 32:
+        return 4  # Blue
+    if t >= 100:
+        return 2  # Red
+    progress = (t - 32) / 68.0
+    if progress < 0.4:
+        return 7  # Cyan
+    if progress <= 0.603:
+        return 3  # Green
+    if progress < 0.8:
+        return 5  # Yellow
+    return 8  # Orange
+
+
+# Temperature color lookup for 0-169°F (out-of-range values are blue/red)
+_TEMP_COLOR = bytes(_compute_temp_color(t) for t in range(170))
+
+
+def temp_color_index(temp_f: int) -> int:
+    """Get palette color index for a temperature in °F (table lookup)"""
+    return _TEMP_COLOR[max(0, min(169, temp_f))]
+
+
 class Config:
     """Application configuration manager"""
 
+    # Seconds to reuse the last is_night_time() result (schedule has minute precision)
+    NIGHT_CACHE_TTL = 30
+
     def __init__(self, config_path="config.yaml"):
         self.config_path = Path(config_path)
         self.data = {}
         self._is_night = False
+        self._sun_cache_key = None
+        self._sun_cache = None
+        self._night_cache_expiry = 0.0
+        self._night_cache_val = False
         self.load()
+        self._parse_schedule()
         self._init_palettes()
         self._init_night_mode()
 
@@ -38,7 +78,7 @@ class Config:
             )
 
         with open(self.config_path, 'r') as f:
-            self.data = yaml.safe_load(f)
+            self.data = yaml.load(f, Loader=YamlLoader)
 
         # Validate required fields
         required = ['aio', 'display']
@@ -46,6 +86,20 @@ class Config:
             if field not in self.data:
                 raise ValueError(f"Missing required config section: {field}")
 
+    def _parse_schedule(self):
+        """Parse night schedule times once (is_night_time runs from the main loop)"""
+        schedule = self.data.get('schedule', {})
+        self._auto_dim_enabled = schedule.get('enable_auto_dimming', True)
+        self._night_start = None
+        self._night_end = None
+
+        try:
+            self._night_start = datetime.strptime(schedule.get('night_start', '22:00'), '%H:%M').time()
+            self._night_end = datetime.strptime(schedule.get('night_end', '07:00'), '%H:%M').time()
+        except Exception as e:
+            logging.error(f"Invalid night schedule, auto dimming by schedule disabled: {e}")
+            self._auto_dim_enabled = False
+
     def _init_palettes(self):
         """Initialize day and night color palettes"""
         # Day palette - Full brightness vibrant colors
@@ -86,9 +140,14 @@ class Config:
             for k, (r, g, b) in self.day_palette.items()
         }
 
+        # Index-ordered tuples for O(1) lookup by color index (0-27)
+        self._day_list = tuple(self.day_palette[i] for i in range(len(self.day_palette)))
+        self._night_list = tuple(self.night_palette[i] for i in range(len(self.night_palette)))
+        self._active_palette = self._night_list if self._is_night else self._day_list
+
     def get_palette(self):
-        """Get current color palette based on day/night mode"""
-        return self.night_palette if self._is_night else self.day_palette
+        """Get current color palette (tuple indexed by color 0-27) for day/night mode"""
+        return self._active_palette
 
     def _init_night_mode(self):
         """Calculate initial night mode at startup based on location and time"""
@@ -102,46 +161,79 @@ class Config:
             latitude = location_data.get('latitude', 39.03)
             longitude = location_data.get('longitude', -94.68)
 
-            # Calculate sunrise/sunset for today
-            location = LocationInfo(latitude=latitude, longitude=longitude)
-            s = sun(location.observer, date=datetime.now().date())
-            now = datetime.now(s['sunrise'].tzinfo)
-            is_night = now < s['sunrise'] or now > s['sunset']
+            # Calculate sunrise/sunset for today (single clock read; astral returns UTC)
+            now = datetime.now(timezone.utc)
+            s = self._get_sun_times(latitude, longitude, now.astimezone().date())
+            is_night = not (s['sunrise'] <= now <= s['sunset'])
 
-            self._is_night = is_night
+            self.set_night_mode(is_night)
             logging.info(f"Initial night mode: {'NIGHT' if is_night else 'DAY'} (sunrise: {s['sunrise'].strftime('%H:%M')}, sunset: {s['sunset'].strftime('%H:%M')}, now: {now.strftime('%H:%M')})")
 
         except Exception as e:
             logging.error(f"Failed to calculate initial night mode: {e}")
-            self._is_night = False
+            self.set_night_mode(False)
+
+    def _get_sun_times(self, latitude, longitude, date):
+        """
+        Get astral sunrise/sunset times for a location and date.
+
+        Single-slot cache keyed by (lat, lon, date) - the result only changes
+        once per day for a stationary display.
+        """
+        key = (round(latitude, 3), round(longitude, 3), date)
+        if key != self._sun_cache_key:
+            location = LocationInfo(latitude=latitude, longitude=longitude)
+            self._sun_cache = sun(location.observer, date=date)
+            self._sun_cache_key = key
+        return self._sun_cache
+
+    def is_sun_down(self, latitude, longitude):
+        """
+        Check whether the sun is currently down at a location using astral.
+
+        Fallback for weather payloads without sunrise/sunset. Keeps the
+        current mode if astral is unavailable or cannot compute sun times.
+        """
+        if not ASTRAL_AVAILABLE:
+            return self._is_night
+
+        try:
+            now = datetime.now(timezone.utc)
+            s = self._get_sun_times(latitude, longitude, now.astimezone().date())
+            return not (s['sunrise'] <= now <= s['sunset'])
+        except Exception as e:
+            logging.warning(f"Could not calculate sunrise/sunset: {e}")
+            return self._is_night
 
     def set_night_mode(self, is_night):
         """Set day/night mode (called by weather module or scheduler)"""
         self._is_night = is_night
+        self._active_palette = self._night_list if is_night else self._day_list
 
     def is_night_time(self):
         """Check if current time is in night mode based on schedule"""
-        if not self.data.get('schedule', {}).get('enable_auto_dimming', True):
+        if not self._auto_dim_enabled:
             return False
 
-        schedule = self.data.get('schedule', {})
-        night_start = schedule.get('night_start', '22:00')
-        night_end = schedule.get('night_end', '07:00')
+        # Reuse the last answer for a few seconds instead of reading the wall clock every call
+        mono = time.monotonic()
+        if mono < self._night_cache_expiry:
+            return self._night_cache_val
 
-        try:
-            now = datetime.now().time()
-            start = datetime.strptime(night_start, '%H:%M').time()
-            end = datetime.strptime(night_end, '%H:%M').time()
-
-            if start <= end:
-                # Same day range (e.g., 22:00 - 23:59)
-                return start <= now <= end
-            else:
-                # Crosses midnight (e.g., 22:00 - 07:00)
-                return now >= start or now <= end
-        except Exception as e:
-            logging.error(f"Error checking night time: {e}")
-            return False
+        now = datetime.now().time()
+        start = self._night_start
+        end = self._night_end
+
+        if start <= end:
+            # Same day range (e.g., 22:00 - 23:59)
+            is_night = start <= now <= end
+        else:
+            # Crosses midnight (e.g., 22:00 - 07:00)
+            is_night = now >= start or now <= end
+
+        self._night_cache_val = is_night
+        self._night_cache_expiry = mono + self.NIGHT_CACHE_TTL
+        return is_night
 
     # Convenience accessors (cached to avoid repeated dict lookups)
     # Config is loaded once at startup and never changes, so caching is safe
@@ -157,6 +249,11 @@ class Config:
     def aio_feed(self):
         return self.data['aio'].get('feed', 'matrixmessage')
 
+    @cached_property
+    def aio_group(self):
+        """Optional feed group key; REST polls fetch the whole group in one request"""
+        return self.data['aio'].get('group')
+
     @cached_property
     def weather_location_id(self):
         return self.data['aio'].get('weather_location_id', 2815)
@@ -169,10 +266,20 @@ class Config:
     def rest_enabled(self):
         return self.data['aio'].get('rest', {}).get('enabled', True)
 
+    @property
+    def auto_dimming_enabled(self):
+        """Whether day/night mode follows the schedule (False if the schedule failed to parse)"""
+        return self._auto_dim_enabled
+
     @cached_property
     def rest_poll_interval(self):
         return self.data['aio'].get('rest', {}).get('poll_interval', 10)
 
+    @cached_property
+    def rest_daily_budget(self):
+        """Max REST polls per day for adaptive scheduling (0 = fixed poll_interval)"""
+        return self.data['aio'].get('rest', {}).get('daily_budget', 0)
+
     @cached_property
     def display_width(self):
         return self.data['display'].get('width', 64)
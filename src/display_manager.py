@@ -5,11 +5,15 @@ Uses hzeller/rpi-rgb-led-matrix library
 
 import logging
 import time
-from typing import Optional, List, Tuple, Dict
+from threading import Lock, Thread
+from typing import Optional, List, Tuple, Dict, Iterable
 from PIL import Image, ImageDraw, ImageFont
 from pathlib import Path
 from functools import lru_cache
 
+from .config import temp_color_index
+from .text_renderer import calculate_layout
+
 try:
     from rgbmatrix import RGBMatrix, RGBMatrixOptions, graphics
     MATRIX_AVAILABLE = True
@@ -17,6 +21,114 @@ except ImportError:
     MATRIX_AVAILABLE = False
     logging.warning("rgbmatrix library not available - running in simulation mode")
 
+FONT_DIR = Path(__file__).parent.parent / "fonts"
+ICON_DIR = Path(__file__).parent.parent / "icons"
+
+# Predefined layouts: preset name -> (color, size, text) lines
+_PRESET_MAP = {
+    "ON-CALL": ((2, 4, "ON-CALL"), (1, 3, "Urgent"), (1, 2, "Needs Only")),
+    "FREE": ((3, 7, "FREE"), (1, 3, "But Knock")),
+    "BUSY": ((2, 3, "BUSY"), (2, 3, "DO NOT"), (2, 3, "ENTER")),
+    "QUIET": ((9, 6, "QUIET"), (22, 2, "MEETING IN"), (22, 2, "PROGRESS")),
+    "KNOCK": ((4, 6, "KNOCK"), (22, 2, "MEETING IN"), (22, 2, "PROGRESS")),
+}
+
+# Pressure trend arrows for the weather pressure readout
+_TREND_ARROWS = {'rising': '↑', 'falling': '↓', 'steady': '→'}
+
+
+@lru_cache(maxsize=8)
+def _brightness_lut(multiplier: float) -> List[int]:
+    """Image.point() table scaling each RGB band by multiplier (clamped to 255)"""
+    return [min(255, int(v * multiplier)) for v in range(256)] * 3
+
+
+# Weather fields drawn by show_weather (anything else can change without a redraw)
+_SHOW_WEATHER_FIELDS = ('temp', 'temp_color', 'feels_like', 'feels_like_color', 'wind_speed',
+                        'wind_dir', 'humidity', 'pressure', 'pressure_trend', 'is_night')
+
+
+@lru_cache(maxsize=64)
+def _cached_layout(lines: tuple, display_height: int) -> tuple:
+    """calculate_layout() memoized on a hashable tuple of parsed lines"""
+    return tuple(calculate_layout(list(lines), display_height))
+
+
+# Map specific BDF fonts to size slots
+# Sizes 4-7 provide graduated large font options
+BDF_FONT_FILES = {
+    1: "4x6.bdf",          # Small (6px)
+    2: "5x8.bdf",          # Medium (8px)
+    3: "ter-u12n.bdf",     # Large (12px)
+    4: "9x15B.bdf",        # XLarge Bold (15px) - for ON-CALL preset
+    5: "10x20.bdf",        # XXLarge (20px)
+    6: "ter-u22b.bdf",     # Huge Bold (22px) - for QUIET preset
+    7: "texgyre-27.bdf",   # Massive (24px) - for FREE preset
+}
+
+# Point sizes for TTF fallback fonts
+TTF_FONT_SIZES = {1: 6, 2: 8, 3: 12, 4: 15, 5: 20, 6: 22, 7: 24}
+
+# Map Apple WeatherKit condition codes to Tomorrow.io icon codes
+# Format: {code}{night_flag}_{description}_small.bmp
+# Night flag: 1 suffix for night (e.g., 10001 for clear night)
+# Note: "Clear" has different day/night descriptions (sunny vs night)
+_DAY_ICON_MAP = {
+    "Clear": "1000_clear_sunny",
+    "MostlyClear": "1100_mostly_clear",
+    "PartlyCloudy": "1101_partly_cloudy",
+    "MostlyCloudy": "1102_mostly_cloudy",
+    "Cloudy": "1001_cloudy",
+    "Fog": "2000_fog",
+    "LightFog": "2100_fog_light",
+    "Drizzle": "4000_drizzle",
+    "Rain": "4001_rain",
+    "LightRain": "4200_rain_light",
+    "HeavyRain": "4201_rain_heavy",
+    "Snow": "5000_snow",
+    "Flurries": "5001_flurries",
+    "LightSnow": "5100_snow_light",
+    "HeavySnow": "5101_snow_heavy",
+    "FreezingDrizzle": "6000_freezing_rain_drizzle",
+    "FreezingRain": "6001_freezing_rain",
+    "LightFreezingRain": "6200_freezing_rain_light",
+    "HeavyFreezingRain": "6201_freezing_rain_heavy",
+    "IcePellets": "7000_ice_pellets",
+    "HeavyIcePellets": "7101_ice_pellets_heavy",
+    "LightIcePellets": "7102_ice_pellets_light",
+    "Thunderstorms": "8000_tstorm",
+}
+
+_NIGHT_ICON_MAP = {
+    "Clear": "10001_clear_night",  # Special case: different description for night
+    "MostlyClear": "11001_mostly_clear",
+    "PartlyCloudy": "11011_partly_cloudy",
+    "MostlyCloudy": "11021_mostly_cloudy",
+    "Cloudy": "10011_cloudy",
+    "Fog": "20001_fog",
+    "LightFog": "21001_fog_light",
+    "Drizzle": "40001_drizzle",
+    "Rain": "40011_rain",
+    "LightRain": "42001_rain_light",
+    "HeavyRain": "42011_rain_heavy",
+    "Snow": "50001_snow",
+    "Flurries": "50011_flurries",
+    "LightSnow": "51001_snow_light",
+    "HeavySnow": "51011_snow_heavy",
+    "FreezingDrizzle": "60001_freezing_rain_drizzle",
+    "FreezingRain": "60011_freezing_rain",
+    "LightFreezingRain": "62001_freezing_rain_light",
+    "HeavyFreezingRain": "62011_freezing_rain_heavy",
+    "IcePellets": "70001_ice_pellets",
+    "HeavyIcePellets": "71011_ice_pellets_heavy",
+    "LightIcePellets": "71021_ice_pellets_light",
+    "Thunderstorms": "80001_tstorm",
+}
+
+
+# Conditions whose scaled icons are prepared at startup
+_PREWARM_CONDITIONS = ("Clear", "PartlyCloudy", "Cloudy", "Rain", "Snow", "Thunderstorms")
+
 
 class DisplayManager:
     """Manages the RGB LED matrix display"""
@@ -31,21 +143,59 @@ class DisplayManager:
         self.config = config
         self.matrix = None
         self.canvas = None
-        self.current_image = None
 
         # Forecast carousel state
         self.carousel_view = 0  # 0 = hourly, 1 = daily
         self.carousel_needs_redraw = True  # Flag for full redraw vs progress-only update
         self.carousel_clear_frames = 0  # Counter for double-buffer clearing (need 2 frames to clear both buffers)
-
-        # Font cache
-        self.fonts = {}
+        self.carousel_refresh_frames = 0  # Full redraws (with progress bar) left after new forecast data
+
+        # Progress bar fraction per elapsed second (config values are fixed after load)
+        self._flip_interval_inv = 1.0 / config.forecast_flip_interval
+
+        # Carousel view renderers indexed by carousel_view, all taking
+        # (current_weather, hourly_forecasts, daily_forecasts)
+        self._carousel_renderers = (
+            lambda current, hourly, daily: self._render_hourly_view(current, hourly),
+            lambda current, hourly, daily: self._render_daily_view(daily, current),
+        )
+
+        # graphics.Color per palette entry (rebuilt when the active palette changes)
+        self._colors_palette = None
+        self._palette_colors = ()
+        self._color_cache: Dict[Tuple[int, int, int], "graphics.Color"] = {}
+
+        # Persistent frame image for the PIL text path (cleared in place each frame)
+        # Locked because commands can render from the AIO worker thread too
+        self._scratch_img = Image.new('RGB', (config.display_width, config.display_height), (0, 0, 0))
+        self._scratch_draw = ImageDraw.Draw(self._scratch_img)
+        self._scratch_lock = Lock()
+
+        # Key of the last frame swapped in (show_text / weather progress) and how
+        # many consecutive swaps drew it (2 = both double-buffer canvases hold it)
+        self._last_render_key = None
+        self._render_key_buffers = 0
+
+        # Font cache (fonts load on first use; prefetched in the background so
+        # startup isn't blocked parsing BDF files)
         self._load_fonts()
+        Thread(target=self._prefetch_fonts, daemon=True).start()
 
         # Weather icon cache (preload all icons to avoid disk I/O during rendering)
         self._icon_cache: Dict[str, Image.Image] = {}
         self._preload_weather_icons()
 
+        # Resolved icons by (condition, is_night, size) - skips path/key building per frame
+        self._icon_lookup: Dict[Tuple[str, bool, int], Optional[Image.Image]] = {}
+
+        # Brightness-scaled icons by (condition, is_night, size, multiplier)
+        self._scaled_icons: Dict[Tuple[str, bool, int, float], Optional[Image.Image]] = {}
+        self._icon_runs: Dict[Tuple[str, bool, int, float], tuple] = {}
+
+        # Scale the common conditions in the background so the first frame
+        # showing them doesn't stall on the brightness pass
+        Thread(target=self.prewarm_icons, args=(_PREWARM_CONDITIONS,), daemon=True).start()
+
         # Initialize matrix
         if MATRIX_AVAILABLE:
             self._init_matrix()
@@ -80,83 +230,119 @@ class DisplayManager:
 
         try:
             self.matrix = RGBMatrix(options=options)
+
+            # Back buffer for drawing; SwapOnVSync() hands back the previous
+            # front buffer, so every swap must reassign self.canvas
             self.canvas = self.matrix.CreateFrameCanvas()
+
+            # Offscreen canvas for text measurement (never swapped to the display)
+            self._measure_canvas = self.matrix.CreateFrameCanvas()
+            self._measure_color = graphics.Color(0, 0, 0)
             logging.info(f"Initialized {options.cols}x{options.rows} RGB matrix")
         except Exception as e:
             logging.error(f"Failed to initialize matrix: {e}")
             raise
 
     def _load_fonts(self):
-        """Load fonts for text rendering using native graphics.Font() for BDF"""
+        """Set up font metadata; font files are loaded on first use by _get_font()"""
+        self.fonts = {}
+        self.fonts_are_bdf = {}
+        self._font_lock = Lock()
+        self._ttf_file = None
+        self._ttf_searched = False
+
+        # Font ascent values for BDF fonts (converts top-left to baseline positioning)
+        # graphics.DrawText() uses baseline, CircuitPython used top-left anchor
+        self.font_ascents = {
+            1: 5,   # 4x6.bdf ascent
+            2: 7,   # 5x8.bdf ascent
+            3: 10,  # ter-u12n.bdf ascent
+            4: 12,  # 9x15B.bdf ascent
+            5: 16,  # 10x20.bdf ascent
+            6: 17,  # ter-u22n.bdf ascent
+            7: 19,  # texgyre-27.bdf ascent
+        }
+
+    def _get_font(self, size: int):
+        """
+        Get font for a size slot, loading it on first use.
+
+        Tries native graphics.Font() BDF, then a TTF from fonts/, then PIL's
+        built-in default. Unknown sizes fall back to size 2.
+        """
+        font = self.fonts.get(size)
+        if font is not None:
+            return font
+
+        if size not in BDF_FONT_FILES:
+            return self._get_font(2)
+
+        # Serialize loads with the startup prefetch thread (each file is parsed once)
+        with self._font_lock:
+            font = self.fonts.get(size)
+            if font is None:
+                font, is_bdf = self._load_font(size)
+                self.fonts_are_bdf[size] = is_bdf
+                self.fonts[size] = font
+        return font
+
+    def _load_font(self, size: int):
+        """
+        Load the font for a size slot from disk
+
+        Returns:
+            (font, is_bdf) tuple
+        """
+        font = None
+        is_bdf = False
         try:
-            font_dir = Path(__file__).parent.parent / "fonts"
-
-            # Default to PIL built-in fonts
-            self.fonts = {
-                1: ImageFont.load_default(),
-                2: ImageFont.load_default(),
-                3: ImageFont.load_default(),
-                4: ImageFont.load_default(),
-                5: ImageFont.load_default(),
-                6: ImageFont.load_default(),
-                7: ImageFont.load_default(),
-            }
-            self.fonts_are_bdf = {1: False, 2: False, 3: False, 4: False, 5: False, 6: False, 7: False}
-
-            # Font ascent values for BDF fonts (converts top-left to baseline positioning)
-            # graphics.DrawText() uses baseline, CircuitPython used top-left anchor
-            self.font_ascents = {
-                1: 5,   # 4x6.bdf ascent
-                2: 7,   # 5x8.bdf ascent
-                3: 10,  # ter-u12n.bdf ascent
-                4: 12,  # 9x15B.bdf ascent
-                5: 16,  # 10x20.bdf ascent
-                6: 17,  # ter-u22n.bdf ascent
-                7: 19,  # texgyre-27.bdf ascent
-            }
-
-            # Try to load BDF fonts using native graphics.Font() if available
-            if font_dir.exists() and MATRIX_AVAILABLE:
-                # Map specific BDF fonts to size slots
-                # Sizes 4-7 provide graduated large font options
-                font_mapping = {
-                    1: "4x6.bdf",          # Small (6px)
-                    2: "5x8.bdf",          # Medium (8px)
-                    3: "ter-u12n.bdf",     # Large (12px)
-                    4: "9x15B.bdf",        # XLarge Bold (15px) - for ON-CALL preset
-                    5: "10x20.bdf",        # XXLarge (20px)
-                    6: "ter-u22b.bdf",     # Huge Bold (22px) - for QUIET preset
-                    7: "texgyre-27.bdf",   # Massive (24px) - for FREE preset
-                }
-
-                for size, filename in font_mapping.items():
-                    font_path = font_dir / filename
-                    if font_path.exists():
-                        try:
-                            # Use native graphics.Font() for BDF fonts
-                            font = graphics.Font()
-                            font.LoadFont(str(font_path))
-                            self.fonts[size] = font
-                            self.fonts_are_bdf[size] = True
-                            logging.info(f"Loaded BDF font size {size}: {filename}")
-                        except Exception as e:
-                            logging.warning(f"Could not load BDF font {filename}: {e}")
-
-                # Also try TTF fonts as fallback for sizes not loaded
-                ttf_files = list(font_dir.glob("*.ttf"))
-                if ttf_files:
-                    for size in [1, 2, 3, 4, 5, 6, 7]:
-                        if not self.fonts_are_bdf[size]:
-                            try:
-                                font_sizes = {1: 6, 2: 8, 3: 12, 4: 15, 5: 20, 6: 22, 7: 24}
-                                self.fonts[size] = ImageFont.truetype(str(ttf_files[0]), font_sizes[size])
-                                logging.info(f"Loaded TTF font for size {size}")
-                            except Exception as e:
-                                logging.warning(f"Could not load TTF font for size {size}: {e}")
+            # Use native graphics.Font() for BDF fonts if available
+            font_path = FONT_DIR / BDF_FONT_FILES[size]
+            if MATRIX_AVAILABLE and font_path.exists():
+                try:
+                    font = graphics.Font()
+                    font.LoadFont(str(font_path))
+                    is_bdf = True
+                    logging.info(f"Loaded BDF font size {size}: {font_path.name}")
+                except Exception as e:
+                    font = None
+                    logging.warning(f"Could not load BDF font {font_path.name}: {e}")
+
+            # Also try TTF fonts as fallback for sizes not loaded
+            if font is None and MATRIX_AVAILABLE:
+                if not self._ttf_searched:
+                    ttf_files = sorted(FONT_DIR.glob("*.ttf")) if FONT_DIR.exists() else []
+                    self._ttf_file = ttf_files[0] if ttf_files else None
+                    self._ttf_searched = True
+                if self._ttf_file:
+                    try:
+                        font = ImageFont.truetype(str(self._ttf_file), TTF_FONT_SIZES[size])
+                        logging.info(f"Loaded TTF font for size {size}")
+                    except Exception as e:
+                        logging.warning(f"Could not load TTF font for size {size}: {e}")
 
         except Exception as e:
             logging.warning(f"Font loading error: {e}")
 
+        if font is None:
+            # Default to PIL built-in font
+            font = ImageFont.load_default()
+
+        return font, is_bdf
+
+    def _prefetch_fonts(self):
+        """Background thread: load every font slot so first renders don't parse BDF files"""
+        for size in BDF_FONT_FILES:
+            self._get_font(size)
+        logging.debug("Font prefetch complete")
+
+    def _is_bdf(self, size: int) -> bool:
+        """Check if the font for a size slot is a native BDF font (loads it if needed)"""
+        if size not in BDF_FONT_FILES:
+            size = 2
+        self._get_font(size)
+        return self.fonts_are_bdf[size]
+
     def _preload_weather_icons(self):
         """
         Preload all weather icons into memory to avoid disk I/O during rendering.
@@ -169,7 +355,7 @@ class DisplayManager:
         This eliminates repeated Image.open() calls during every frame render.
         """
         try:
-            icon_dir = Path(__file__).parent.parent / "icons"
+            icon_dir = ICON_DIR
             if not icon_dir.exists():
                 logging.warning(f"Icon directory not found: {icon_dir}")
                 return
@@ -211,11 +397,10 @@ class DisplayManager:
 
     def clear(self):
         """Clear the display"""
+        self._last_render_key = None
         if self.matrix:
             self.canvas.Clear()
-            self.matrix.SwapOnVSync(self.canvas)
-
-        self.current_image = None
+            self.canvas = self.matrix.SwapOnVSync(self.canvas)
 
     def show_text(self, parsed_lines: List[Tuple[int, int, str]]):
         """
@@ -231,32 +416,35 @@ class DisplayManager:
         # Sync hardware brightness with day/night mode
         self.sync_brightness_with_night_mode()
 
+        # Same text and palette as the frame already on screen - nothing to redraw
+        lines = tuple(parsed_lines)
+        render_key = (lines, self.config._is_night)
+        if render_key == self._last_render_key:
+            return
+
         # Get current palette
         palette = self.config.get_palette()
 
         # Calculate positions
-        from .text_renderer import calculate_layout
-        positioned_lines = calculate_layout(parsed_lines, self.config.display_height)
+        positioned_lines = _cached_layout(lines, self.config.display_height)
 
         # Check if all fonts are BDF (can use direct canvas drawing)
-        all_bdf = all(self.fonts_are_bdf.get(size, False) for _, size, _, _ in positioned_lines)
+        all_bdf = all(self._is_bdf(size) for _, size, _, _ in positioned_lines)
 
         if all_bdf and self.matrix:
             # All BDF fonts - draw directly on canvas for better performance
-            self.canvas.Clear()
+            colors = self._get_palette_colors()
 
-            # First pass: calculate text widths by drawing offscreen
+            # Build draw plan from cached widths (no canvas access)
             text_info = []
             for color_idx, size, y_pos, text in positioned_lines:
                 if not text.strip():
                     continue
 
-                font = self.fonts.get(size, self.fonts[2])
-                color = palette.get(color_idx, (255, 255, 255))
-                text_color = graphics.Color(color[0], color[1], color[2])
+                font = self._get_font(size)
+                text_color = colors[color_idx]
 
-                # Draw at position -1000 to measure width without being visible
-                text_width = graphics.DrawText(self.canvas, font, -1000, y_pos, text_color, text)
+                text_width = self._text_width(size, text)
                 x_pos = (self.config.display_width - text_width) // 2
 
                 # Manual horizontal offset for specific text
@@ -270,7 +458,7 @@ class DisplayManager:
 
                 text_info.append((font, x_pos, baseline_y, text_color, text))
 
-            # Clear canvas and draw all text at correct positions
+            # Single clear, then draw all text at correct positions
             self.canvas.Clear()
             for font, x_pos, baseline_y, text_color, text in text_info:
                 graphics.DrawText(self.canvas, font, x_pos, baseline_y, text_color, text)
@@ -280,29 +468,87 @@ class DisplayManager:
 
         else:
             # Mixed fonts or PIL only - use image-based rendering
-            img = Image.new('RGB', (self.config.display_width, self.config.display_height), color=(0, 0, 0))
-            draw = ImageDraw.Draw(img)
+            with self._scratch_lock:
+                img = self._scratch_img
+                draw = self._scratch_draw
+                draw.rectangle((0, 0, img.width - 1, img.height - 1), fill=(0, 0, 0))
 
-            for color_idx, size, y_pos, text in positioned_lines:
-                if not text.strip():
-                    continue
+                for color_idx, size, y_pos, text in positioned_lines:
+                    if not text.strip():
+                        continue
 
-                font = self.fonts.get(size, self.fonts[2])
-                color = palette.get(color_idx, (255, 255, 255))
+                    font = self._get_font(size)
+                    color = palette[color_idx]
 
-                # Regular PIL font
-                bbox = draw.textbbox((0, 0), text, font=font)
-                text_width = bbox[2] - bbox[0]
-                x_pos = (self.config.display_width - text_width) // 2
+                    # Regular PIL font
+                    text_width = self._pil_text_width(size, text)
+                    x_pos = (self.config.display_width - text_width) // 2
 
-                # Manual horizontal offset for specific text
-                if text == "ON-CALL":
-                    x_pos += 1  # Move right by 1px
+                    # Manual horizontal offset for specific text
+                    if text == "ON-CALL":
+                        x_pos += 1  # Move right by 1px
+
+                    draw.text((x_pos, y_pos), text, font=font, fill=color)
+
+                # Display image
+                self._show_image(img)
+
+        self._mark_frame(render_key)
+
+    def _mark_frame(self, key):
+        """Record the key of the frame just swapped onto the display"""
+        if key == self._last_render_key:
+            self._render_key_buffers += 1
+        else:
+            self._last_render_key = key
+            self._render_key_buffers = 1
 
-                draw.text((x_pos, y_pos), text, font=font, fill=color)
+    @lru_cache(maxsize=256)
+    def _text_width(self, size: int, text: str) -> int:
+        """
+        Get rendered width of text in BDF font size (cached).
+
+        Measured once per (size, text) on an offscreen canvas; preset and
+        label strings repeat every frame, so later calls skip DrawText.
+        """
+        font = self._get_font(size)
+        return graphics.DrawText(self._measure_canvas, font, -1000, 0, self._measure_color, text)
+
+    @lru_cache(maxsize=256)
+    def _pil_text_width(self, size: int, text: str) -> int:
+        """
+        Get advance width of text in a PIL (TTF/default) font size (cached).
+
+        getlength() (what ImageDraw.textlength uses) only computes the
+        horizontal advance, unlike textbbox().
+        """
+        return int(self._get_font(size).getlength(text))
+
+    def _get_color(self, rgb: Tuple[int, int, int]):
+        """
+        Get graphics.Color for an (r, g, b) tuple, created once per distinct color.
+
+        Weather and forecast renderers pick colors straight from the palette,
+        so this set stays small (day + night palettes).
+        """
+        color = self._color_cache.get(rgb)
+        if color is None:
+            color = graphics.Color(rgb[0], rgb[1], rgb[2])
+            self._color_cache[rgb] = color
+        return color
 
-            # Display image
-            self._show_image(img)
+    def _get_palette_colors(self) -> tuple:
+        """
+        Get graphics.Color objects for the active palette, indexed by color 0-27.
+
+        Rebuilt only when the palette changes (day/night switch), so render
+        paths don't construct a Color per text line.
+        """
+        palette = self.config.get_palette()
+        if palette is not self._colors_palette:
+            self._palette_colors = tuple(graphics.Color(r, g, b) for r, g, b in palette)
+            self._colors_palette = palette
+        return self._palette_colors
 
     def show_preset(self, preset_name: str):
         """
@@ -313,16 +559,9 @@ class DisplayManager:
         """
         preset_name = preset_name.upper().strip()
 
-        preset_map = {
-            "ON-CALL": [(2, 4, "ON-CALL"), (1, 3, "Urgent"), (1, 2, "Needs Only")],
-            "FREE": [(3, 7, "FREE"), (1, 3, "But Knock")],
-            "BUSY": [(2, 3, "BUSY"), (2, 3, "DO NOT"), (2, 3, "ENTER")],
-            "QUIET": [(9, 6, "QUIET"), (22, 2, "MEETING IN"), (22, 2, "PROGRESS")],
-            "KNOCK": [(4, 6, "KNOCK"), (22, 2, "MEETING IN"), (22, 2, "PROGRESS")],
-        }
-
-        if preset_name in preset_map:
-            self.show_text(preset_map[preset_name])
+        lines = _PRESET_MAP.get(preset_name)
+        if lines is not None:
+            self.show_text(lines)
         else:
             logging.warning(f"Unknown preset: {preset_name}")
             self.show_simple_message("Unknown", "Preset")
@@ -353,152 +592,29 @@ class DisplayManager:
             logging.debug("Matrix not available - weather would be displayed")
             return
 
-        try:
-            # Sync hardware brightness with day/night mode
-            self.sync_brightness_with_night_mode()
+        # Sync hardware brightness with day/night mode
+        self.sync_brightness_with_night_mode()
 
-            palette = self.config.get_palette()
+        # Same visible fields and palette as the frame already on screen - nothing to redraw
+        palette = self.config.get_palette()
+        render_key = ("weather", condition, palette,
+                      tuple(weather_data.get(field) for field in _SHOW_WEATHER_FIELDS))
+        if render_key == self._last_render_key:
+            return
 
+        try:
             # Clear canvas
             self.canvas.Clear()
-            logging.debug(f"Rendering weather: condition={condition}, is_night={weather_data.get('is_night', False)}")
-
-            # Get cached weather icon (24x24)
-            icon = self._get_cached_icon(condition, weather_data.get('is_night', False), size=24)
-
-            if icon:
-                try:
-                    # Draw icon pixel by pixel at top-right (x=40, y=0)
-                    # Adjust brightness to match text (night palette is 25% = /4)
-                    # Day: 2x boost, Night: 2x * 0.25 = 0.5x to match night palette
-                    is_night = weather_data.get('is_night', False)
-                    brightness_multiplier = self._get_icon_brightness_multiplier(is_night, mode='weather')
-
-                    for y in range(min(24, self.config.display_height)):
-                        for x in range(24):
-                            if x + 40 < self.config.display_width:
-                                r, g, b = icon.getpixel((x, y))
-                                # Only draw non-black pixels (transparent background)
-                                if r > 0 or g > 0 or b > 0:
-                                    # Adjust brightness to match text
-                                    r = min(255, int(r * brightness_multiplier))
-                                    g = min(255, int(g * brightness_multiplier))
-                                    b = min(255, int(b * brightness_multiplier))
-                                    self.canvas.SetPixel(x + 40, y, r, g, b)
-                    logging.debug("Weather icon drawn from cache")
-                except Exception as e:
-                    logging.error(f"Error drawing weather icon: {e}", exc_info=True)
-            else:
-                logging.warning(f"Weather icon not found in cache: {condition}")
-
-            # Get BDF fonts
-            font_large = self.fonts.get(3, self.fonts[2])  # Size 3 for temperature
-            font_small = self.fonts.get(1, self.fonts[2])  # Size 1 for details
-
-            # Check if fonts are BDF
-            if not self.fonts_are_bdf.get(3, False) or not self.fonts_are_bdf.get(1, False):
-                logging.warning("BDF fonts not loaded, weather display may not render correctly")
-
-            # Temperature (large, left side) - matches CircuitPython layout
-            temp = weather_data.get('temp', 0)
-            temp_color = palette.get(weather_data.get('temp_color', 1), (255, 255, 255))
-            temp_str = str(temp)
-
-            temp_graphics_color = graphics.Color(temp_color[0], temp_color[1], temp_color[2])
-            baseline_y = 0 + self.font_ascents.get(3, 10)  # Convert top-left to baseline
-
-            # Draw temperature number
-            temp_width = graphics.DrawText(self.canvas, font_large, 1, baseline_y, temp_graphics_color, temp_str)
-
-            # Draw "F" after temperature (positioned dynamically based on temp digits)
-            f_x = 1 + len(temp_str) * 7 + 2
-            graphics.DrawText(self.canvas, font_large, f_x, baseline_y, temp_graphics_color, "F")
-
-            # Additional weather info (smaller, bottom) - matches CircuitPython positions
-            feels = weather_data.get('feels_like', temp)
-            feels_color = palette.get(weather_data.get('feels_like_color', 1), (255, 255, 255))
-            wind_speed = weather_data.get('wind_speed', 0)
-            wind_dir = weather_data.get('wind_dir', 'N')
-            humidity = weather_data.get('humidity', 0)
-
-            # Line 2: Feels like (y=10) - feels_like colored
-            feels_graphics_color = graphics.Color(feels_color[0], feels_color[1], feels_color[2])
-            baseline_y2 = 10 + self.font_ascents.get(2, 7)
-            graphics.DrawText(self.canvas, self.fonts.get(2, font_small), 1, baseline_y2, feels_graphics_color, f"FL{feels}F")
-
-            # Line 3: Wind (y=17) - color 8 (orange) with 2px spacing between components
-            wind_color = palette.get(8, (255, 165, 0))  # Orange
-            wind_graphics_color = graphics.Color(wind_color[0], wind_color[1], wind_color[2])
-            baseline_y3 = 17 + self.font_ascents.get(2, 7)
-
-            # Draw wind components separately with 2px spacing
-            current_x = 1
-            # Draw direction
-            dir_width = graphics.DrawText(self.canvas, self.fonts.get(2, font_small), current_x, baseline_y3, wind_graphics_color, wind_dir)
-            current_x += dir_width + 2  # 2px spacing
-
-            # Draw speed
-            speed_str = f"{wind_speed:02d}"
-            speed_width = graphics.DrawText(self.canvas, self.fonts.get(2, font_small), current_x, baseline_y3, wind_graphics_color, speed_str)
-            current_x += speed_width + 2  # 2px spacing
-
-            # Draw MPH
-            graphics.DrawText(self.canvas, self.fonts.get(2, font_small), current_x, baseline_y3, wind_graphics_color, "MPH")
+            logging.debug("Rendering weather: condition=%s, is_night=%s", condition, weather_data.get('is_night', False))
 
             # Line 4: Humidity (y=24) - color 9 (pink/magenta)
-            humidity_color = palette.get(9, (255, 0, 255))  # Pink/Magenta
-            humidity_graphics_color = graphics.Color(humidity_color[0], humidity_color[1], humidity_color[2])
-            baseline_y4 = 24 + self.font_ascents.get(2, 7)
-            graphics.DrawText(self.canvas, self.fonts.get(2, font_small), 1, baseline_y4, humidity_graphics_color, f"RH{humidity}%")
-
-            # Pressure with trend arrow - right-aligned on same line as humidity
-            pressure = weather_data.get('pressure', 0)
-            pressure_trend = weather_data.get('pressure_trend', 'steady')
-
-            # Map trend to arrow
-            trend_arrows = {'rising': '↑', 'falling': '↓', 'steady': '→'}
-            arrow = trend_arrows.get(pressure_trend.lower(), '→')
-
-            # Split pressure into parts for smaller decimal point
-            pressure_int = int(pressure)
-            pressure_dec = int((pressure - pressure_int) * 100)  # Get 2 decimal places
-
-            font_medium = self.fonts.get(2, font_small)
-            font_tiny = self.fonts.get(1, font_small)
-
-            # Measure widths offscreen
-            arrow_int_width = graphics.DrawText(self.canvas, font_medium, -1000, baseline_y4, humidity_graphics_color, f"{arrow}{pressure_int}")
-            period_width = graphics.DrawText(self.canvas, font_tiny, -1000, baseline_y4, humidity_graphics_color, ".")
-            dec_width = graphics.DrawText(self.canvas, font_medium, -1000, baseline_y4, humidity_graphics_color, f"{pressure_dec:02d}")
-            in_width = graphics.DrawText(self.canvas, font_tiny, -1000, baseline_y4 - 1, humidity_graphics_color, "in")
-
-            # Calculate total width with tighter decimal spacing (reduce gaps by 1px each)
-            leading_space = 2  # Space before arrow (away from %)
-            tighter_spacing = -1  # Negative to overlap/tighten
-            total_width = leading_space + arrow_int_width + period_width + tighter_spacing + dec_width + tighter_spacing + in_width
-            pressure_x = self.config.display_width - total_width - 1  # 1px margin from right
-
-            # Add leading space
-            current_x = pressure_x + leading_space
-
-            # Draw arrow + integer part (size 2)
-            graphics.DrawText(self.canvas, font_medium, current_x, baseline_y4, humidity_graphics_color, f"{arrow}{pressure_int}")
-            current_x += arrow_int_width
-
-            # Draw period (size 1 - smaller) with tighter spacing
-            graphics.DrawText(self.canvas, font_tiny, current_x + tighter_spacing, baseline_y4, humidity_graphics_color, ".")
-            current_x += period_width + tighter_spacing
-
-            # Draw decimal digits (size 2) with tighter spacing
-            graphics.DrawText(self.canvas, font_medium, current_x + tighter_spacing, baseline_y4, humidity_graphics_color, f"{pressure_dec:02d}")
-            current_x += dec_width + tighter_spacing
-
-            # Draw "in" (size 1) moved up 3px from baseline
-            graphics.DrawText(self.canvas, font_tiny, current_x, baseline_y4 - 1, humidity_graphics_color, "in")
+            humidity = weather_data.get('humidity', 0)
+            self._render_current_conditions(weather_data, condition, palette, f"RH{humidity}%", palette[9])
 
             logging.debug("Weather text rendered, swapping canvas")
             # Swap canvas to display
             self.canvas = self.matrix.SwapOnVSync(self.canvas)
+            self._mark_frame(render_key)
             logging.info("Weather display updated successfully")
 
         except Exception as e:
@@ -530,159 +646,27 @@ class DisplayManager:
 
             palette = self.config.get_palette()
 
-            # Clear canvas
-            self.canvas.Clear()
-
             # Determine which page to show (flip at 15 seconds)
             page = 0 if elapsed_seconds < (duration / 2) else 1
-            logging.debug(f"Rendering weather page {page+1}/2: condition={condition}, elapsed={elapsed_seconds:.1f}s")
 
-            # Get BDF fonts
-            font_large = self.fonts.get(3, self.fonts[2])  # Size 3 for main value
-            font_medium = self.fonts.get(2, self.fonts[2])  # Size 2 for secondary
-            font_small = self.fonts.get(1, self.fonts[2])  # Size 1 for tiny text
-
-            # ===== PAGE 1: Temperature, Feels Like, Wind, Cloud Cover, Pressure =====
-            if page == 0:
-                # Get cached weather icon (24x24) for "Weather on 8s"
-                is_night = weather_data.get('is_night', False)
-                icon = self._get_cached_icon(condition, is_night, size=24)
+            # Page content only changes with the page, weather data or palette
+            frame_key = ("weather_progress", page, condition, palette, dict(weather_data))
+            if frame_key == self._last_render_key and self._render_key_buffers >= 2:
+                # Both canvases already hold this page - only the progress row changes
+                graphics.DrawLine(self.canvas, 0, 31, self.config.display_width - 1, 31, self._get_color((0, 0, 0)))
+            else:
+                # Clear canvas
+                self.canvas.Clear()
+                logging.debug("Rendering weather page %d/2: condition=%s, elapsed=%.1fs", page + 1, condition, elapsed_seconds)
 
-                if icon:
-                    try:
-                        brightness_multiplier = self._get_icon_brightness_multiplier(is_night, mode='weather')
-
-                        for y in range(min(24, self.config.display_height)):
-                            for x in range(24):
-                                if x + 40 < self.config.display_width:
-                                    r, g, b = icon.getpixel((x, y))
-                                    if r > 0 or g > 0 or b > 0:
-                                        r = min(255, int(r * brightness_multiplier))
-                                        g = min(255, int(g * brightness_multiplier))
-                                        b = min(255, int(b * brightness_multiplier))
-                                        self.canvas.SetPixel(x + 40, y, r, g, b)
-                        logging.debug("Weather on 8s icon drawn from cache")
-                    except Exception as e:
-                        logging.error(f"Error drawing Weather on 8s icon: {e}", exc_info=True)
+                if page == 0:
+                    # ===== PAGE 1: Temperature, Feels Like, Wind, Cloud Cover, Pressure =====
+                    # Row 24-30: Cloud Cover (Sky Blue) + Pressure
+                    clouds = weather_data.get('clouds', 0)
+                    self._render_current_conditions(weather_data, condition, palette, f"CL{clouds}%", palette[13])
                 else:
-                    logging.warning(f"Weather on 8s icon not found in cache: {condition}")
-
-                # Row 0-9: Temperature (large, left side)
-                temp = weather_data.get('temp', 0)
-                temp_color = palette.get(weather_data.get('temp_color', 1), (255, 255, 255))
-                temp_graphics_color = graphics.Color(temp_color[0], temp_color[1], temp_color[2])
-                baseline_y = 0 + self.font_ascents.get(3, 10)
-
-                temp_str = str(temp)
-                graphics.DrawText(self.canvas, font_large, 1, baseline_y, temp_graphics_color, temp_str)
-                f_x = 1 + len(temp_str) * 7 + 2
-                graphics.DrawText(self.canvas, font_large, f_x, baseline_y, temp_graphics_color, "F")
-
-                # Row 10-16: Feels like
-                feels = weather_data.get('feels_like', temp)
-                feels_color = palette.get(weather_data.get('feels_like_color', 1), (255, 255, 255))
-                feels_graphics_color = graphics.Color(feels_color[0], feels_color[1], feels_color[2])
-                baseline_y2 = 10 + self.font_ascents.get(2, 7)
-                graphics.DrawText(self.canvas, font_medium, 1, baseline_y2, feels_graphics_color, f"FL{feels}F")
-
-                # Row 17-23: Wind (direction, speed, MPH)
-                wind_speed = weather_data.get('wind_speed', 0)
-                wind_dir = weather_data.get('wind_dir', 'N')
-                wind_color = palette.get(8, (255, 165, 0))  # Orange
-                wind_graphics_color = graphics.Color(wind_color[0], wind_color[1], wind_color[2])
-                baseline_y3 = 17 + self.font_ascents.get(2, 7)
-
-                current_x = 1
-                dir_width = graphics.DrawText(self.canvas, font_medium, current_x, baseline_y3, wind_graphics_color, wind_dir)
-                current_x += dir_width + 2
-                speed_width = graphics.DrawText(self.canvas, font_medium, current_x, baseline_y3, wind_graphics_color, f"{wind_speed:02d}")
-                current_x += speed_width + 2
-                graphics.DrawText(self.canvas, font_medium, current_x, baseline_y3, wind_graphics_color, "MPH")
-
-                # Row 24-30: Cloud Cover + Pressure
-                clouds = weather_data.get('clouds', 0)
-                cloud_color = palette.get(13, (135, 206, 235))  # Sky Blue
-                cloud_graphics_color = graphics.Color(cloud_color[0], cloud_color[1], cloud_color[2])
-                baseline_y4 = 24 + self.font_ascents.get(2, 7)
-                graphics.DrawText(self.canvas, font_medium, 1, baseline_y4, cloud_graphics_color, f"CL{clouds}%")
-
-                # Pressure with trend arrow - right-aligned
-                pressure = weather_data.get('pressure', 0)
-                pressure_trend = weather_data.get('pressure_trend', 'steady')
-                trend_arrows = {'rising': '↑', 'falling': '↓', 'steady': '→'}
-                arrow = trend_arrows.get(pressure_trend.lower(), '→')
-
-                pressure_int = int(pressure)
-                pressure_dec = int((pressure - pressure_int) * 100)
-
-                # Measure widths offscreen
-                arrow_int_width = graphics.DrawText(self.canvas, font_medium, -1000, baseline_y4, cloud_graphics_color, f"{arrow}{pressure_int}")
-                period_width = graphics.DrawText(self.canvas, font_small, -1000, baseline_y4, cloud_graphics_color, ".")
-                dec_width = graphics.DrawText(self.canvas, font_medium, -1000, baseline_y4, cloud_graphics_color, f"{pressure_dec:02d}")
-                in_width = graphics.DrawText(self.canvas, font_small, -1000, baseline_y4 - 1, cloud_graphics_color, "in")
-
-                leading_space = 2
-                tighter_spacing = -1
-                total_width = leading_space + arrow_int_width + period_width + tighter_spacing + dec_width + tighter_spacing + in_width
-                pressure_x = self.config.display_width - total_width - 1
-                current_x = pressure_x + leading_space
-
-                graphics.DrawText(self.canvas, font_medium, current_x, baseline_y4, cloud_graphics_color, f"{arrow}{pressure_int}")
-                current_x += arrow_int_width
-                graphics.DrawText(self.canvas, font_small, current_x + tighter_spacing, baseline_y4, cloud_graphics_color, ".")
-                current_x += period_width + tighter_spacing
-                graphics.DrawText(self.canvas, font_medium, current_x + tighter_spacing, baseline_y4, cloud_graphics_color, f"{pressure_dec:02d}")
-                current_x += dec_width + tighter_spacing
-                graphics.DrawText(self.canvas, font_small, current_x, baseline_y4 - 1, cloud_graphics_color, "in")
-
-            # ===== PAGE 2: UV Index, Humidity, Dew Point, Wind Gust =====
-            else:
-                # UV Index color scale function
-                def get_uv_color(uv):
-                    """Get color for UV index based on EPA scale"""
-                    if uv < 3:
-                        return palette.get(3, (0, 255, 0))  # Green (Low)
-                    elif uv < 6:
-                        return palette.get(5, (255, 255, 0))  # Yellow (Moderate)
-                    elif uv < 8:
-                        return palette.get(8, (255, 165, 0))  # Orange (High)
-                    elif uv < 11:
-                        return palette.get(2, (255, 0, 0))  # Red (Very High)
-                    else:
-                        return palette.get(12, (255, 20, 147))  # Deep Pink (Extreme)
-
-                # Row 0-9: UV Index (large)
-                uvi = weather_data.get('uvi', 0)
-                uv_color = get_uv_color(uvi)
-                uv_graphics_color = graphics.Color(uv_color[0], uv_color[1], uv_color[2])
-                baseline_y = 0 + self.font_ascents.get(3, 10)
-
-                # Draw "UV" label
-                graphics.DrawText(self.canvas, font_medium, 1, baseline_y - 2, uv_graphics_color, "UV")
-                # Draw UV index value (large)
-                uv_str = f"{uvi:.1f}" if uvi < 10 else f"{int(uvi)}"
-                graphics.DrawText(self.canvas, font_large, 14, baseline_y, uv_graphics_color, uv_str)
-
-                # Row 10-16: Humidity (moved from page 1)
-                humidity = weather_data.get('humidity', 0)
-                humidity_color = palette.get(9, (255, 0, 255))  # Pink/Magenta
-                humidity_graphics_color = graphics.Color(humidity_color[0], humidity_color[1], humidity_color[2])
-                baseline_y2 = 10 + self.font_ascents.get(2, 7)
-                graphics.DrawText(self.canvas, font_medium, 1, baseline_y2, humidity_graphics_color, f"RH{humidity}%")
-
-                # Row 17-23: Dew Point
-                dew_point = weather_data.get('dew_point', 0)
-                dew_color = palette.get(7, (0, 255, 255))  # Cyan
-                dew_graphics_color = graphics.Color(dew_color[0], dew_color[1], dew_color[2])
-                baseline_y3 = 17 + self.font_ascents.get(2, 7)
-                graphics.DrawText(self.canvas, font_medium, 1, baseline_y3, dew_graphics_color, f"DP{dew_point}F")
-
-                # Row 24-30: Wind Gust
-                wind_gust = weather_data.get('wind_gust', 0)
-                gust_color = palette.get(14, (255, 215, 0))  # Gold
-                gust_graphics_color = graphics.Color(gust_color[0], gust_color[1], gust_color[2])
-                baseline_y4 = 24 + self.font_ascents.get(2, 7)
-                graphics.DrawText(self.canvas, font_medium, 1, baseline_y4, gust_graphics_color, f"GS{wind_gust}MPH")
+                    # ===== PAGE 2: UV Index, Humidity, Dew Point, Wind Gust =====
+                    self._render_weather_details(weather_data, palette)
 
             # Progress bar on row 31 (30-second countdown)
             progress = min(1.0, elapsed_seconds / duration)
@@ -690,20 +674,21 @@ class DisplayManager:
 
             # Color gradient from palette: cyan -> yellow -> orange -> red
             if progress < 0.5:
-                color_rgb = palette.get(7, (0, 255, 255))  # Cyan
+                color_rgb = palette[7]  # Cyan
             elif progress < 0.8:
-                color_rgb = palette.get(5, (255, 255, 0))  # Yellow
+                color_rgb = palette[5]  # Yellow
             elif progress < 0.95:
-                color_rgb = palette.get(8, (255, 128, 0))  # Orange
+                color_rgb = palette[8]  # Orange
             else:
-                color_rgb = palette.get(2, (255, 0, 0))  # Red (warning: about to resume)
+                color_rgb = palette[2]  # Red (warning: about to resume)
 
-            # Draw filled portion of progress bar
-            for x in range(bar_width):
-                self.canvas.SetPixel(x, 31, color_rgb[0], color_rgb[1], color_rgb[2])
+            # Draw filled portion of progress bar (single line primitive)
+            if bar_width > 0:
+                graphics.DrawLine(self.canvas, 0, 31, bar_width - 1, 31, self._get_color(color_rgb))
 
             # Swap canvas to display
             self.canvas = self.matrix.SwapOnVSync(self.canvas)
+            self._mark_frame(frame_key)
             logging.debug("Weather with progress display updated")
 
         except Exception as e:
@@ -713,6 +698,188 @@ class DisplayManager:
             except:
                 pass
 
+    def _render_current_conditions(self, weather_data: dict, condition: str, palette, detail_text: str, detail_rgb: tuple):
+        """
+        Draw the current-conditions page onto the cleared canvas (no swap)
+
+        Shared by show_weather and page 1 of show_weather_with_progress: icon
+        top-right, temperature, feels like and wind rows, then a bottom row
+        with a detail value on the left and pressure right-aligned.
+
+        Args:
+            weather_data: Dictionary with weather values
+            condition: Weather condition code
+            palette: Active color palette
+            detail_text: Bottom-left text (e.g. "RH45%")
+            detail_rgb: Color for the bottom row (detail and pressure)
+        """
+        # Get cached weather icon (24x24), already scaled to display brightness
+        # Adjust brightness to match text (night palette is 25% = /4)
+        # Day: 2x boost, Night: 2x * 0.25 = 0.5x to match night palette
+        is_night = weather_data.get('is_night', False)
+        brightness_multiplier = self._get_icon_brightness_multiplier(is_night, mode='weather')
+        icon = self._get_scaled_icon(condition, is_night, 24, brightness_multiplier)
+
+        if icon:
+            try:
+                # Blit icon in one call at top-right (x=40, y=0)
+                # Canvas was just cleared, so the icon's black (transparent) background
+                # can be copied as-is; SetImage clips to the canvas bounds
+                self.canvas.SetImage(icon, 40, 0)
+                logging.debug("Weather icon drawn from cache")
+            except Exception as e:
+                logging.error(f"Error drawing weather icon: {e}", exc_info=True)
+        else:
+            logging.warning(f"Weather icon not found in cache: {condition}")
+
+        # Get BDF fonts
+        font_large = self._get_font(3)  # Size 3 for temperature
+        font_medium = self._get_font(2)  # Size 2 for detail rows
+        font_small = self._get_font(1)  # Size 1 for pressure decimal point and units
+
+        # Check if fonts are BDF
+        if not self._is_bdf(3) or not self._is_bdf(1):
+            logging.warning("BDF fonts not loaded, weather display may not render correctly")
+
+        # Temperature (large, left side) - matches CircuitPython layout
+        temp = weather_data.get('temp', 0)
+        temp_color = palette[weather_data.get('temp_color', 1)]
+        temp_str = str(temp)
+
+        temp_graphics_color = self._get_color(temp_color)
+        baseline_y = 0 + self.font_ascents.get(3, 10)  # Convert top-left to baseline
+
+        # Draw temperature number (DrawText returns its advance width)
+        temp_width = graphics.DrawText(self.canvas, font_large, 1, baseline_y, temp_graphics_color, temp_str)
+
+        # Draw "F" 2px after the measured temperature digits
+        f_x = 1 + temp_width + 2
+        graphics.DrawText(self.canvas, font_large, f_x, baseline_y, temp_graphics_color, "F")
+
+        # Line 2: Feels like (y=10) - feels_like colored
+        feels = weather_data.get('feels_like', temp)
+        feels_color = palette[weather_data.get('feels_like_color', 1)]
+        feels_graphics_color = self._get_color(feels_color)
+        baseline_y2 = 10 + self.font_ascents.get(2, 7)
+        graphics.DrawText(self.canvas, font_medium, 1, baseline_y2, feels_graphics_color, f"FL{feels}F")
+
+        # Line 3: Wind (y=17) - color 8 (orange) with 2px spacing between components
+        wind_speed = weather_data.get('wind_speed', 0)
+        wind_dir = weather_data.get('wind_dir', 'N')
+        wind_color = palette[8]  # Orange
+        wind_graphics_color = self._get_color(wind_color)
+        baseline_y3 = 17 + self.font_ascents.get(2, 7)
+
+        current_x = 1
+        dir_width = graphics.DrawText(self.canvas, font_medium, current_x, baseline_y3, wind_graphics_color, wind_dir)
+        current_x += dir_width + 2  # 2px spacing
+        speed_width = graphics.DrawText(self.canvas, font_medium, current_x, baseline_y3, wind_graphics_color, f"{wind_speed:02d}")
+        current_x += speed_width + 2  # 2px spacing
+        graphics.DrawText(self.canvas, font_medium, current_x, baseline_y3, wind_graphics_color, "MPH")
+
+        # Line 4 (y=24): detail value on the left
+        detail_graphics_color = self._get_color(detail_rgb)
+        baseline_y4 = 24 + self.font_ascents.get(2, 7)
+        graphics.DrawText(self.canvas, font_medium, 1, baseline_y4, detail_graphics_color, detail_text)
+
+        # Pressure with trend arrow - right-aligned on same line
+        pressure = weather_data.get('pressure', 0)
+        pressure_trend = weather_data.get('pressure_trend', 'steady')
+        arrow = _TREND_ARROWS.get(pressure_trend.lower(), '→')
+
+        # Split pressure into parts for smaller decimal point (integer hundredths,
+        # so e.g. 29.99 can't truncate to .98 through float error)
+        pressure_int, pressure_dec = divmod(round(pressure * 100), 100)
+
+        # Cached BDF widths (no offscreen measurement draw)
+        arrow_int_width = self._text_width(2, f"{arrow}{pressure_int}")
+        period_width = self._text_width(1, ".")
+        dec_width = self._text_width(2, f"{pressure_dec:02d}")
+        in_width = self._text_width(1, "in")
+
+        # Calculate total width with tighter decimal spacing (reduce gaps by 1px each)
+        leading_space = 2  # Space before arrow (away from %)
+        tighter_spacing = -1  # Negative to overlap/tighten
+        total_width = leading_space + arrow_int_width + period_width + tighter_spacing + dec_width + tighter_spacing + in_width
+        pressure_x = self.config.display_width - total_width - 1  # 1px margin from right
+
+        # Add leading space
+        current_x = pressure_x + leading_space
+
+        # Draw arrow + integer part (size 2)
+        graphics.DrawText(self.canvas, font_medium, current_x, baseline_y4, detail_graphics_color, f"{arrow}{pressure_int}")
+        current_x += arrow_int_width
+
+        # Draw period (size 1 - smaller) with tighter spacing
+        graphics.DrawText(self.canvas, font_small, current_x + tighter_spacing, baseline_y4, detail_graphics_color, ".")
+        current_x += period_width + tighter_spacing
+
+        # Draw decimal digits (size 2) with tighter spacing
+        graphics.DrawText(self.canvas, font_medium, current_x + tighter_spacing, baseline_y4, detail_graphics_color, f"{pressure_dec:02d}")
+        current_x += dec_width + tighter_spacing
+
+        # Draw "in" (size 1) moved up 3px from baseline
+        graphics.DrawText(self.canvas, font_small, current_x, baseline_y4 - 1, detail_graphics_color, "in")
+
+    def _render_weather_details(self, weather_data: dict, palette):
+        """
+        Draw page 2 of 'Weather on the 8s' onto the cleared canvas (no swap):
+        UV index, humidity, dew point and wind gust
+
+        Args:
+            weather_data: Dictionary with weather values
+            palette: Active color palette
+        """
+        font_large = self._get_font(3)  # Size 3 for main value
+        font_medium = self._get_font(2)  # Size 2 for secondary
+
+        # UV Index color scale function
+        def get_uv_color(uv):
+            """Get color for UV index based on EPA scale"""
+            if uv < 3:
+                return palette[3]  # Green (Low)
+            elif uv < 6:
+                return palette[5]  # Yellow (Moderate)
+            elif uv < 8:
+                return palette[8]  # Orange (High)
+            elif uv < 11:
+                return palette[2]  # Red (Very High)
+            else:
+                return palette[12]  # Deep Pink (Extreme)
+
+        # Row 0-9: UV Index (large)
+        uvi = weather_data.get('uvi', 0)
+        uv_color = get_uv_color(uvi)
+        uv_graphics_color = self._get_color(uv_color)
+        baseline_y = 0 + self.font_ascents.get(3, 10)
+
+        # Draw "UV" label
+        graphics.DrawText(self.canvas, font_medium, 1, baseline_y - 2, uv_graphics_color, "UV")
+        # Draw UV index value (large)
+        uv_str = f"{uvi:.1f}" if uvi < 10 else f"{int(uvi)}"
+        graphics.DrawText(self.canvas, font_large, 14, baseline_y, uv_graphics_color, uv_str)
+
+        # Row 10-16: Humidity (moved from page 1)
+        humidity = weather_data.get('humidity', 0)
+        humidity_color = palette[9]  # Pink/Magenta
+        humidity_graphics_color = self._get_color(humidity_color)
+        baseline_y2 = 10 + self.font_ascents.get(2, 7)
+        graphics.DrawText(self.canvas, font_medium, 1, baseline_y2, humidity_graphics_color, f"RH{humidity}%")
+
+        # Row 17-23: Dew Point
+        dew_point = weather_data.get('dew_point', 0)
+        dew_color = palette[7]  # Cyan
+        dew_graphics_color = self._get_color(dew_color)
+        baseline_y3 = 17 + self.font_ascents.get(2, 7)
+        graphics.DrawText(self.canvas, font_medium, 1, baseline_y3, dew_graphics_color, f"DP{dew_point}F")
+
+        # Row 24-30: Wind Gust
+        wind_gust = weather_data.get('wind_gust', 0)
+        gust_color = palette[14]  # Gold
+        gust_graphics_color = self._get_color(gust_color)
+        baseline_y4 = 24 + self.font_ascents.get(2, 7)
+        graphics.DrawText(self.canvas, font_medium, 1, baseline_y4, gust_graphics_color, f"GS{wind_gust}MPH")
+
     def flip_carousel_view(self):
         """Flip to next carousel view"""
         self.carousel_view = 1 - self.carousel_view
@@ -720,27 +887,31 @@ class DisplayManager:
         self.carousel_clear_frames = 2  # Clear both buffers to prevent flickering
         logging.info(f"Carousel flipped to: {'DAILY' if self.carousel_view else 'HOURLY'}")
 
+    def refresh_carousel(self):
+        """Redraw the current view in both buffers (new forecast data, same view and progress bar)"""
+        self.carousel_refresh_frames = 2
+
     def show_forecast_carousel(self, current_weather: dict, hourly_forecasts: dict,
                                daily_forecasts: dict, elapsed_seconds: float):
         """Display forecast carousel with auto-flip and progress bar"""
         if not self.matrix:
             return
 
+        self._last_render_key = None
+
         try:
             self.sync_brightness_with_night_mode()
 
             # Check if we need to do full redraws to clear both buffers
             # (RGB matrix uses double-buffering, need to clear both to prevent flickering)
-            needs_full_redraw = self.carousel_needs_redraw or self.carousel_clear_frames > 0
+            needs_full_redraw = (self.carousel_needs_redraw or self.carousel_clear_frames > 0
+                                 or self.carousel_refresh_frames > 0)
 
             if needs_full_redraw:
                 self.canvas.Clear()
 
                 # Render active view
-                if self.carousel_view == 0:
-                    self._render_hourly_view(current_weather, hourly_forecasts)
-                else:
-                    self._render_daily_view(daily_forecasts, current_weather)
+                self._carousel_renderers[self.carousel_view](current_weather, hourly_forecasts, daily_forecasts)
 
                 # Don't draw progress bar during buffer clearing (first 2 frames)
                 # This prevents visual "jump" and ensures clean transition
@@ -751,14 +922,16 @@ class DisplayManager:
                 # Decrement clear counter
                 if self.carousel_clear_frames > 0:
                     self.carousel_clear_frames -= 1
-                    logging.debug(f"Clearing buffer {2 - self.carousel_clear_frames}/2")
+                    logging.debug("Clearing buffer %d/2", 2 - self.carousel_clear_frames)
+
+                if self.carousel_refresh_frames > 0:
+                    self.carousel_refresh_frames -= 1
 
                 self.carousel_needs_redraw = False
             else:
                 # Only update progress bar (row 31) - much faster!
-                # Clear row 31 by drawing black pixels
-                for x in range(self.config.display_width):
-                    self.canvas.SetPixel(x, 31, 0, 0, 0)
+                # Clear row 31 with a black line
+                graphics.DrawLine(self.canvas, 0, 31, self.config.display_width - 1, 31, self._get_color((0, 0, 0)))
 
                 # Redraw progress bar
                 self._render_progress_bar(elapsed_seconds)
@@ -770,18 +943,7 @@ class DisplayManager:
 
     def _get_temp_color_index(self, temp_f: int) -> int:
         """Get palette color index for temperature"""
-        if temp_f <= 32:
-            return 4  # Blue
-        if temp_f >= 100:
-            return 2  # Red
-        progress = (temp_f - 32) / 68.0
-        if progress < 0.4:
-            return 7  # Cyan
-        if progress <= 0.603:
-            return 3  # Green
-        if progress < 0.8:
-            return 5  # Yellow
-        return 8  # Orange
+        return temp_color_index(temp_f)
 
     def _abbreviate_condition(self, condition: str) -> str:
         """Abbreviate weather condition to 2-4 chars"""
@@ -805,8 +967,15 @@ class DisplayManager:
     def _render_hourly_view(self, current_weather: dict, hourly_forecasts: dict):
         """Render 3-panel hourly forecast: NOW | +6H | +12H"""
         palette = self.config.get_palette()
-        font_tiny = self.fonts.get(1)
-        font_small = self.fonts.get(2)
+        font_tiny = self._get_font(1)
+        font_small = self._get_font(2)
+
+        # Per-frame constants bound once outside the panel loop
+        canvas = self.canvas
+        draw_text = graphics.DrawText
+        ascent_tiny = self.font_ascents.get(1, 5)
+        ascent_small = self.font_ascents.get(2, 7)
+        white_color = self._get_color(palette[1])  # White (dimmed at night)
 
         panels = [
             {'x': 0, 'width': 21, 'label': 'NOW', 'data': current_weather},
@@ -822,49 +991,48 @@ class DisplayManager:
             w = panel['width']
 
             # Line 1: Time label (centered, from palette)
-            label_rgb = palette.get(1, (255, 255, 255))  # White (dimmed at night)
-            label_color = graphics.Color(label_rgb[0], label_rgb[1], label_rgb[2])
-            label_w = graphics.DrawText(self.canvas, font_tiny, -1000, 0, label_color, panel['label'])
+            label_w = self._text_width(1, panel['label'])
             label_x = x_offset + (w - label_w) // 2
-            graphics.DrawText(self.canvas, font_tiny, label_x,
-                             self.font_ascents.get(1, 5), label_color, panel['label'])
+            draw_text(canvas, font_tiny, label_x, ascent_tiny, white_color, panel['label'])
 
             # Line 2: Temperature (centered, color-coded) - matches daily view
             temp = panel['data'].get('temp', 0)
             temp_str = str(temp)
             temp_idx = self._get_temp_color_index(temp)
-            temp_rgb = palette.get(temp_idx, (255, 255, 255))
-            temp_color = graphics.Color(temp_rgb[0], temp_rgb[1], temp_rgb[2])
+            temp_rgb = palette[temp_idx]
+            temp_color = self._get_color(temp_rgb)
 
-            temp_w = graphics.DrawText(self.canvas, font_small, -1000, 0, temp_color, temp_str)
+            temp_w = self._text_width(2, temp_str)
             temp_x = x_offset + (w - temp_w) // 2
-            graphics.DrawText(self.canvas, font_small, temp_x,
-                             8 + self.font_ascents.get(2, 7), temp_color, temp_str)
+            draw_text(canvas, font_small, temp_x, 8 + ascent_small, temp_color, temp_str)
 
             # Line 3: Condition abbreviation (centered) - matches daily view position
             condition = panel['data'].get('condition', 'Clear')
             abbrev = self._abbreviate_condition(condition)
-            cond_rgb = palette.get(1, (255, 255, 255))
-            cond_color = graphics.Color(cond_rgb[0], cond_rgb[1], cond_rgb[2])
-
-            cond_w = graphics.DrawText(self.canvas, font_tiny, -1000, 0, cond_color, abbrev)
+            cond_w = self._text_width(1, abbrev)
             cond_x = x_offset + (w - cond_w) // 2
-            graphics.DrawText(self.canvas, font_tiny, cond_x,
-                             17 + self.font_ascents.get(1, 5), cond_color, abbrev)
+            draw_text(canvas, font_tiny, cond_x, 17 + ascent_tiny, white_color, abbrev)
 
             # Line 4: Precipitation percentage (centered) - matches daily view
             precip = panel['data'].get('precip_chance', 0)
             precip_str = f"{precip}"
-            precip_w = graphics.DrawText(self.canvas, font_tiny, -1000, 0, cond_color, precip_str)
+            precip_w = self._text_width(1, precip_str)
             precip_x = x_offset + (w - precip_w) // 2
-            graphics.DrawText(self.canvas, font_tiny, precip_x,
-                             24 + self.font_ascents.get(1, 5), cond_color, precip_str)
+            draw_text(canvas, font_tiny, precip_x, 24 + ascent_tiny, white_color, precip_str)
 
     def _render_daily_view(self, daily_forecasts: dict, current_weather: dict = None):
         """Render 2-panel daily forecast with icons: TODAY | TOMORROW"""
         palette = self.config.get_palette()
-        font_tiny = self.fonts.get(1)
-        font_small = self.fonts.get(2)
+        font_tiny = self._get_font(1)
+        font_small = self._get_font(2)
+
+        # Per-frame constants bound once outside the panel loop
+        canvas = self.canvas
+        draw_text = graphics.DrawText
+        ascent_tiny = self.font_ascents.get(1, 5)
+        ascent_small = self.font_ascents.get(2, 7)
+        white_color = self._get_color(palette[1])  # White (dimmed at night)
+        brightness_multiplier = self._get_icon_brightness_multiplier(self.config._is_night, mode='forecast')
 
         day_labels = ['TODAY', 'TMR']
         panels = [
@@ -899,34 +1067,32 @@ class DisplayManager:
                     # After 1 hour before sunset: show overnight forecast
                     is_night = True
                     display_temp = temp_min
-                    logging.debug(f"TODAY forecast: Using night mode (within 1hr of sunset), temp={temp_min}")
+                    logging.debug("TODAY forecast: Using night mode (within 1hr of sunset), temp=%s", temp_min)
                 else:
                     # Before 1 hour before sunset: show daytime forecast
                     is_night = False
                     display_temp = temp_max
-                    logging.debug(f"TODAY forecast: Using day mode, temp={temp_max}")
+                    logging.debug("TODAY forecast: Using day mode, temp=%s", temp_max)
             else:  # TOMORROW and beyond
                 # Always use day icon and high temp for future days
                 is_night = False
                 display_temp = temp_max
-                logging.debug(f"Day +{day_offset} forecast: Using day mode, temp={temp_max}")
+                logging.debug("Day +%d forecast: Using day mode, temp=%s", day_offset, temp_max)
 
             # Row 0-5: Day label (centered)
-            label_rgb = palette.get(1, (255, 255, 255))
-            label_color = graphics.Color(label_rgb[0], label_rgb[1], label_rgb[2])
-            label_w = graphics.DrawText(self.canvas, font_tiny, -1000, 0, label_color, panel['label'])
+            label_w = self._text_width(1, panel['label'])
             label_x = x_offset + (w - label_w) // 2
-            graphics.DrawText(self.canvas, font_tiny, label_x, 0 + self.font_ascents.get(1, 5), label_color, panel['label'])
+            draw_text(canvas, font_tiny, label_x, 0 + ascent_tiny, white_color, panel['label'])
 
             # Row 6-29: Weather icon and temperature (side-by-side, centered in panel)
             # Prepare temperature text and color
             temp_idx = self._get_temp_color_index(display_temp)
-            temp_rgb = palette.get(temp_idx, (255, 255, 255))
-            temp_color = graphics.Color(temp_rgb[0], temp_rgb[1], temp_rgb[2])
+            temp_rgb = palette[temp_idx]
+            temp_color = self._get_color(temp_rgb)
             temp_text = str(display_temp)
 
             # Measure temperature text width (using font_small - one size larger)
-            temp_w = graphics.DrawText(self.canvas, font_small, -1000, 0, temp_color, temp_text)
+            temp_w = self._text_width(2, temp_text)
 
             # Calculate layout: icon (20px) + gap (2px) + temp text
             icon_width = 20
@@ -938,72 +1104,64 @@ class DisplayManager:
             start_x = x_offset + (w - total_width) // 2
 
             # Get cached icon (20x20 for daily forecast)
-            icon = self._get_cached_icon(condition, is_night, size=20)
+            # Brightness: 0.125x at night, 1.0x during day (87.5% dimmer)
+            icon = self._get_scaled_icon(condition, is_night, 20, brightness_multiplier)
+
+            # Position icon at start of centered group
+            icon_x = start_x
+            icon_y = 6  # Positioned 6px from top
+
             if icon:
                 try:
-                    # Position icon at start of centered group
-                    icon_x = start_x
-                    icon_y = 6  # Positioned 6px from top
-
-                    # Brightness: 0.125x at night, 1.0x during day (87.5% dimmer)
-                    brightness_multiplier = self._get_icon_brightness_multiplier(self.config._is_night, mode='forecast')
-                    logging.debug(f"Daily forecast brightness: night_mode={self.config._is_night}, multiplier={brightness_multiplier}")
-
-                    for y in range(20):
-                        for x in range(20):
-                            r, g, b = icon.getpixel((x, y))
-                            if r > 0 or g > 0 or b > 0:  # Skip black pixels (transparent)
-                                r = min(255, int(r * brightness_multiplier))
-                                g = min(255, int(g * brightness_multiplier))
-                                b = min(255, int(b * brightness_multiplier))
-                                self.canvas.SetPixel(icon_x + x, icon_y + y, r, g, b)
+                    # Blit runs of non-black pixels (black is transparent)
+                    for x, y, run in self._get_icon_runs(condition, is_night, 20, brightness_multiplier):
+                        canvas.SetImage(run, icon_x + x, icon_y + y)
                 except Exception as e:
                     logging.error(f"Error drawing daily forecast icon: {e}")
 
             # Render temperature next to icon, vertically centered with icon
             temp_x = start_x + icon_width + gap
-            temp_y = icon_y + (icon_height // 2) + (self.font_ascents.get(2, 7) // 2)
-            graphics.DrawText(self.canvas, font_small, temp_x, temp_y, temp_color, temp_text)
+            temp_y = icon_y + (icon_height // 2) + (ascent_small // 2)
+            draw_text(canvas, font_small, temp_x, temp_y, temp_color, temp_text)
 
             # Row 30-31: Condition + precipitation (centered)
             abbrev = self._abbreviate_condition(condition)
             precip_str = f"{precip}"
             info_text = f"{abbrev} {precip_str}"
 
-            white_rgb = palette.get(1, (255, 255, 255))
-            white_color = graphics.Color(white_rgb[0], white_rgb[1], white_rgb[2])
-
-            info_w = graphics.DrawText(self.canvas, font_tiny, -1000, 0, white_color, info_text)
+            info_w = self._text_width(1, info_text)
             info_x = x_offset + (w - info_w) // 2
-            graphics.DrawText(self.canvas, font_tiny, info_x, 30, white_color, info_text)
+            draw_text(canvas, font_tiny, info_x, 30, white_color, info_text)
 
     def _render_progress_bar(self, elapsed_seconds: float):
         """Render animated progress bar on row 31 with smooth gradient"""
         palette = self.config.get_palette()
-        flip_interval = self.config.forecast_flip_interval
-        progress = min(1.0, elapsed_seconds / flip_interval)
+        display_width = self.config.display_width
+        progress = elapsed_seconds * self._flip_interval_inv
+        if progress > 1.0:
+            progress = 1.0
 
         # Calculate bar width with sub-pixel precision
-        bar_width_float = progress * self.config.display_width
+        bar_width_float = progress * display_width
         bar_width = int(bar_width_float)
         fractional = bar_width_float - bar_width
 
         # Color gradient from palette: cyan -> yellow -> orange -> red
         if progress < 0.5:
-            color_rgb = palette.get(7, (0, 255, 255))  # Cyan
+            color_rgb = palette[7]  # Cyan
         elif progress < 0.8:
-            color_rgb = palette.get(5, (255, 255, 0))  # Yellow
+            color_rgb = palette[5]  # Yellow
         elif progress < 0.95:
-            color_rgb = palette.get(8, (255, 128, 0))  # Orange
+            color_rgb = palette[8]  # Orange
         else:
-            color_rgb = palette.get(2, (255, 0, 0))  # Red (warning: about to flip)
+            color_rgb = palette[2]  # Red (warning: about to flip)
 
-        # Draw filled portion of progress bar
-        for x in range(bar_width):
-            self.canvas.SetPixel(x, 31, color_rgb[0], color_rgb[1], color_rgb[2])
+        # Draw filled portion of progress bar (single line primitive)
+        if bar_width > 0:
+            graphics.DrawLine(self.canvas, 0, 31, bar_width - 1, 31, self._get_color(color_rgb))
 
         # Add smooth gradient at leading edge (anti-aliasing)
-        if bar_width < self.config.display_width and fractional > 0:
+        if bar_width < display_width and fractional > 0:
             # Fade-in effect for the next pixel
             fade_r = int(color_rgb[0] * fractional)
             fade_g = int(color_rgb[1] * fractional)
@@ -1031,6 +1189,89 @@ class DisplayManager:
         else:
             return 1.0
 
+    def _scale_icon(self, icon: Image.Image, multiplier: float) -> Image.Image:
+        """
+        Scale icon brightness in a single pass (clamped to 255).
+
+        Uses a precomputed lookup table applied to all three bands by
+        Image.point(), instead of a multiply + clamp per pixel in Python.
+        """
+        return icon.point(_brightness_lut(multiplier))
+
+    def prewarm_icons(self, conditions: Iterable[str]):
+        """
+        Prepare scaled icons and draw runs for the given conditions ahead of use.
+
+        Covers day and night variants of the current-weather (24px) and
+        daily-forecast (20px) icons. Call off the render thread.
+
+        Args:
+            conditions: Weather condition strings (e.g., "Clear", "Rain")
+        """
+        for condition in set(conditions):
+            for is_night in (False, True):
+                self._get_scaled_icon(condition, is_night, 24,
+                                      self._get_icon_brightness_multiplier(is_night, mode='weather'))
+                self._get_icon_runs(condition, is_night, 20,
+                                    self._get_icon_brightness_multiplier(is_night, mode='forecast'))
+        logging.debug("Icon prewarm complete")
+
+    def _get_scaled_icon(self, condition: str, is_night: bool, size: int, multiplier: float) -> Optional[Image.Image]:
+        """
+        Get weather icon from cache, already scaled to display brightness.
+
+        Scaled variants are kept per (condition, is_night, size, multiplier),
+        so each combination is scaled once rather than every frame.
+
+        Returns:
+            Scaled PIL Image, or None if the icon is not available
+        """
+        key = (condition, is_night, size, multiplier)
+        if key in self._scaled_icons:
+            return self._scaled_icons[key]
+
+        icon = self._get_cached_icon(condition, is_night, size)
+        if icon is not None:
+            icon = self._scale_icon(icon, multiplier)
+
+        self._scaled_icons[key] = icon
+        return icon
+
+    def _get_icon_runs(self, condition: str, is_night: bool, size: int, multiplier: float) -> tuple:
+        """
+        Get a scaled icon split into horizontal runs of non-black pixels (cached).
+
+        Lets icons be drawn over existing content with one SetImage per run
+        instead of one SetPixel per pixel, while black stays transparent.
+
+        Returns:
+            Tuple of (x, y, 1-row run image), empty if the icon is not available
+        """
+        key = (condition, is_night, size, multiplier)
+        runs = self._icon_runs.get(key)
+        if runs is not None:
+            return runs
+
+        runs = []
+        icon = self._get_scaled_icon(condition, is_night, size, multiplier)
+        if icon is not None:
+            width, height = icon.size
+            pixels = icon.load()
+            for y in range(height):
+                x = 0
+                while x < width:
+                    if pixels[x, y] == (0, 0, 0):
+                        x += 1
+                        continue
+                    start = x
+                    while x < width and pixels[x, y] != (0, 0, 0):
+                        x += 1
+                    runs.append((start, y, icon.crop((start, y, x, y + 1))))
+
+        runs = tuple(runs)
+        self._icon_runs[key] = runs
+        return runs
+
     def _get_cached_icon(self, condition: str, is_night: bool, size: int = 24) -> Optional[Image.Image]:
         """
         Get weather icon from memory cache.
@@ -1043,21 +1284,20 @@ class DisplayManager:
         Returns:
             PIL Image object from cache, or None if not found
         """
-        # Get the icon filename using existing mapping logic
-        icon_path = self._get_weather_icon_path(condition, is_night)
-        if not icon_path:
-            return None
+        lookup_key = (condition, is_night, size)
+        if lookup_key in self._icon_lookup:
+            return self._icon_lookup[lookup_key]
 
-        # Build cache key
-        cache_key = f"{icon_path.stem}_{size}"
-
-        # Return from cache
-        icon = self._icon_cache.get(cache_key)
-        if icon:
-            logging.debug(f"Icon cache hit: {cache_key}")
-        else:
-            logging.debug(f"Icon cache miss: {cache_key}")
+        # First request for this combination: resolve filename using existing mapping logic
+        icon = None
+        icon_path = self._get_weather_icon_path(condition, is_night)
+        if icon_path:
+            cache_key = f"{icon_path.stem}_{size}"
+            icon = self._icon_cache.get(cache_key)
+            if icon is None:
+                logging.debug("Icon cache miss: %s", cache_key)
 
+        self._icon_lookup[lookup_key] = icon
         return icon
 
     @lru_cache(maxsize=128)
@@ -1068,78 +1308,16 @@ class DisplayManager:
         Cached to avoid repeated string processing and path lookups.
         With ~70 total weather conditions, 128 cache entries is plenty.
         """
-        icon_dir = Path(__file__).parent.parent / "icons"
-
-        if not icon_dir.exists():
-            logging.warning(f"Icons directory not found: {icon_dir}")
+        if not ICON_DIR.exists():
+            logging.warning(f"Icons directory not found: {ICON_DIR}")
             return None
 
-        logging.debug(f"Looking for icon: condition='{condition}', is_night={is_night}, icon_dir={icon_dir}")
-
-        # Map Apple WeatherKit condition codes to Tomorrow.io icon codes
-        # Format: {code}{night_flag}_{description}_small.bmp
-        # Night flag: 1 suffix for night (e.g., 10001 for clear night)
-        # Note: "Clear" has different day/night descriptions (sunny vs night)
-
-        # Use separate maps for day and night
-        if is_night:
-            icon_map = {
-                "Clear": "10001_clear_night",  # Special case: different description for night
-                "MostlyClear": "11001_mostly_clear",
-                "PartlyCloudy": "11011_partly_cloudy",
-                "MostlyCloudy": "11021_mostly_cloudy",
-                "Cloudy": "10011_cloudy",
-                "Fog": "20001_fog",
-                "LightFog": "21001_fog_light",
-                "Drizzle": "40001_drizzle",
-                "Rain": "40011_rain",
-                "LightRain": "42001_rain_light",
-                "HeavyRain": "42011_rain_heavy",
-                "Snow": "50001_snow",
-                "Flurries": "50011_flurries",
-                "LightSnow": "51001_snow_light",
-                "HeavySnow": "51011_snow_heavy",
-                "FreezingDrizzle": "60001_freezing_rain_drizzle",
-                "FreezingRain": "60011_freezing_rain",
-                "LightFreezingRain": "62001_freezing_rain_light",
-                "HeavyFreezingRain": "62011_freezing_rain_heavy",
-                "IcePellets": "70001_ice_pellets",
-                "HeavyIcePellets": "71011_ice_pellets_heavy",
-                "LightIcePellets": "71021_ice_pellets_light",
-                "Thunderstorms": "80001_tstorm",
-            }
-        else:
-            icon_map = {
-                "Clear": "1000_clear_sunny",
-                "MostlyClear": "1100_mostly_clear",
-                "PartlyCloudy": "1101_partly_cloudy",
-                "MostlyCloudy": "1102_mostly_cloudy",
-                "Cloudy": "1001_cloudy",
-                "Fog": "2000_fog",
-                "LightFog": "2100_fog_light",
-                "Drizzle": "4000_drizzle",
-                "Rain": "4001_rain",
-                "LightRain": "4200_rain_light",
-                "HeavyRain": "4201_rain_heavy",
-                "Snow": "5000_snow",
-                "Flurries": "5001_flurries",
-                "LightSnow": "5100_snow_light",
-                "HeavySnow": "5101_snow_heavy",
-                "FreezingDrizzle": "6000_freezing_rain_drizzle",
-                "FreezingRain": "6001_freezing_rain",
-                "LightFreezingRain": "6200_freezing_rain_light",
-                "HeavyFreezingRain": "6201_freezing_rain_heavy",
-                "IcePellets": "7000_ice_pellets",
-                "HeavyIcePellets": "7101_ice_pellets_heavy",
-                "LightIcePellets": "7102_ice_pellets_light",
-                "Thunderstorms": "8000_tstorm",
-            }
-
+        icon_map = _NIGHT_ICON_MAP if is_night else _DAY_ICON_MAP
         icon_base = icon_map.get(condition, "1000_clear_sunny" if not is_night else "10001_clear_night")
         logging.debug(f"Icon mapping ({'night' if is_night else 'day'}): '{condition}' -> '{icon_base}'")
 
         # Icons are BMP files with _small suffix
-        icon_path = icon_dir / f"{icon_base}_small.bmp"
+        icon_path = ICON_DIR / f"{icon_base}_small.bmp"
         logging.debug(f"Looking for icon file: {icon_path}")
 
         if icon_path.exists():
@@ -1169,18 +1347,11 @@ class DisplayManager:
             if img.size != (self.config.display_width, self.config.display_height):
                 img = img.resize((self.config.display_width, self.config.display_height))
 
-            # Clear canvas
-            self.canvas.Clear()
-
-            # Set pixels
-            for y in range(self.config.display_height):
-                for x in range(self.config.display_width):
-                    r, g, b = img.getpixel((x, y))
-                    self.canvas.SetPixel(x, y, r, g, b)
+            # Bulk blit (native copy of the whole RGB buffer; image covers the full canvas)
+            self.canvas.SetImage(img, 0, 0)
 
             # Swap buffers
             self.canvas = self.matrix.SwapOnVSync(self.canvas)
-            self.current_image = img
 
         except Exception as e:
             logging.error(f"Error displaying image: {e}")
@@ -1188,8 +1359,9 @@ class DisplayManager:
     def sync_brightness_with_night_mode(self):
         """Ensure hardware brightness stays constant regardless of day/night mode"""
         if self.matrix:
-            palette_type = "NIGHT" if self.config._is_night else "DAY"
-            logging.debug(f"sync_brightness: HW brightness={self.config.brightness}, Palette={palette_type}")
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                palette_type = "NIGHT" if self.config._is_night else "DAY"
+                logging.debug("sync_brightness: HW brightness=%s, Palette=%s", self.config.brightness, palette_type)
             self.matrix.brightness = self.config.brightness
 
     def __del__(self):
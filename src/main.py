@@ -4,12 +4,16 @@ LED Matrix Display System - Main Application
 Raspberry Pi Zero W 2 + Adafruit RGB Matrix HAT
 """
 
+import atexit
 import logging
+import queue
 import signal
 import sys
 import time
+from threading import Event
 from pathlib import Path
 from enum import Enum, auto
+from logging.handlers import QueueHandler, QueueListener
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -58,11 +62,16 @@ class LEDMatrixApp:
         # State
         self.last_command = None
         self.current_weather = None
+        self._forecasts = ({}, {})  # (hourly, daily) copies, replaced on each weather update
         self.running = False
+        self._wake_event = Event()  # Set to run the next main loop tick immediately
+        self._stop_signal = None  # Signal number that requested shutdown
+        self._shutdown_done = False
+        self._weather_ready = Event()  # Set once current + hourly + daily weather are loaded
         self.forecast_mode_active = False
         self.forecast_flip_timer = 0.0
-        self.last_loop_time = time.time()
-        self.startup_time = time.time()
+        self.last_loop_time = time.monotonic()
+        self.startup_time = time.monotonic()
         self.startup_auto_forecast_timeout = 60  # seconds after startup
         self.startup_auto_forecast_enabled = True  # Only auto-forecast once during startup
 
@@ -72,6 +81,17 @@ class LEDMatrixApp:
         self.weather_on_8s_timer = 0.0  # Timer for 30-second display
         self.weather_on_8s_duration = 30  # seconds
 
+        # Special commands (uppercased) mapped to their handlers; anything else is formatted text
+        self._command_handlers = {
+            "OFF": self._cmd_clear,
+            "BLANK": self._cmd_clear,
+            "SCREEN OFF": self._cmd_clear,
+            "WEATHER": self._cmd_weather,
+            "FORECAST": self._cmd_forecast,
+        }
+        for preset in ("ON-CALL", "FREE", "BUSY", "QUIET", "KNOCK"):
+            self._command_handlers[preset] = self._cmd_preset
+
         # Setup signal handlers
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
@@ -110,20 +130,37 @@ class LEDMatrixApp:
             except Exception as e:
                 print(f"Warning: Could not setup file logging: {e}")
 
+        # Console/file output runs on a listener thread, so a slow SD card write
+        # (or log rotation) never stalls the main loop or client threads
+        log_queue = queue.Queue(-1)
+        self._log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        self._log_listener.start()
+        # Stopped at exit (not in shutdown()) so records logged after shutdown,
+        # e.g. fatal errors in main(), are still flushed to console/file
+        atexit.register(self._log_listener.stop)
+
         # Configure root logger directly (basicConfig doesn't work if logging already initialized)
         root_logger = logging.getLogger()
         root_logger.setLevel(log_level)
         # Clear any existing handlers
         root_logger.handlers.clear()
-        # Add our handlers
-        for handler in handlers:
-            root_logger.addHandler(handler)
+        # Records go through the queue to the listener's handlers
+        root_logger.addHandler(QueueHandler(log_queue))
 
     def _signal_handler(self, signum, frame):
-        """Handle shutdown signals"""
-        logging.info(f"Received signal {signum}, shutting down...")
-        self.shutdown()
-        sys.exit(0)
+        """
+        Handle shutdown signals.
+
+        Only flags the main loop to stop; shutdown() then runs from the main
+        loop, not inside the handler (which may interrupt logging or locks).
+        Takes no locks itself (not even _wake_event) - the loop's 1s wait
+        timeout picks the flag up.
+        """
+        if not self.running:
+            # Not started yet (or already stopping) - nothing to unwind
+            sys.exit(0)
+        self._stop_signal = signum
+        self.running = False
 
     def _on_command_received(self, message: dict):
         """Handle command from Adafruit IO"""
@@ -150,35 +187,10 @@ class LEDMatrixApp:
         try:
             # Special commands
             cmd_upper = command.upper().strip()
+            handler = self._command_handlers.get(cmd_upper)
 
-            if cmd_upper in ["OFF", "BLANK", "SCREEN OFF"]:
-                logging.info("Clearing display")
-                self.forecast_mode_active = False
-                self.display.clear()
-
-            elif cmd_upper == "WEATHER":
-                logging.info("Displaying weather")
-                self.forecast_mode_active = False
-                if self.current_weather:
-                    condition = self.current_weather.get('condition', 'Clear')
-                    self.display.show_weather(self.current_weather, condition)
-                else:
-                    self.display.show_simple_message("Weather", "Waiting...")
-
-            elif cmd_upper == "FORECAST":
-                logging.info("Displaying forecast carousel")
-                self.forecast_mode_active = True
-                self.forecast_flip_timer = 0.0
-                self.last_loop_time = time.time()
-                self.display.carousel_needs_redraw = True  # Trigger initial full redraw
-                self.display.carousel_clear_frames = 2  # Clear both buffers to prevent flickering
-                # Initial display will happen in main loop
-
-            elif cmd_upper in ["ON-CALL", "FREE", "BUSY", "QUIET", "KNOCK"]:
-                logging.info(f"Displaying preset: {cmd_upper}")
-                self.forecast_mode_active = False
-                self.display.show_preset(cmd_upper)
-
+            if handler:
+                handler(cmd_upper)
             else:
                 # Parse and display formatted text
                 logging.info("Displaying formatted text")
@@ -194,11 +206,63 @@ class LEDMatrixApp:
             logging.error(f"Error processing command: {e}", exc_info=True)
             self.display.show_simple_message("Error", str(e)[:12])
 
+    def _cmd_clear(self, cmd_upper: str):
+        """OFF / BLANK / SCREEN OFF: clear the display"""
+        logging.info("Clearing display")
+        self.forecast_mode_active = False
+        self.display.clear()
+
+    def _cmd_weather(self, cmd_upper: str):
+        """WEATHER: show current conditions"""
+        logging.info("Displaying weather")
+        self.forecast_mode_active = False
+        if self.current_weather:
+            condition = self.current_weather.get('condition', 'Clear')
+            self.display.show_weather(self.current_weather, condition)
+        else:
+            self.display.show_simple_message("Weather", "Waiting...")
+
+    def _cmd_forecast(self, cmd_upper: str):
+        """FORECAST: start the forecast carousel"""
+        logging.info("Displaying forecast carousel")
+        self.forecast_mode_active = True
+        self.forecast_flip_timer = 0.0
+        self.last_loop_time = time.monotonic()
+        self.display.carousel_needs_redraw = True  # Trigger initial full redraw
+        self.display.carousel_clear_frames = 2  # Clear both buffers to prevent flickering
+        # Initial display will happen in main loop (woken now rather than next tick)
+        self._wake_event.set()
+
+    def _cmd_preset(self, cmd_upper: str):
+        """ON-CALL / FREE / BUSY / QUIET / KNOCK: show preset layout"""
+        logging.info(f"Displaying preset: {cmd_upper}")
+        self.forecast_mode_active = False
+        self.display.show_preset(cmd_upper)
+
     def _on_weather_update(self, weather_data: dict):
         """Handle weather update"""
         self.current_weather = weather_data
         logging.debug(f"Weather updated: {weather_data.get('temp')}°F")
 
+        # Scale icons for any new conditions now, on the weather thread,
+        # rather than on the first frame that shows them
+        if self.weather_client:
+            hourly = self.weather_client.get_hourly_forecasts()
+            daily = self.weather_client.get_daily_forecasts()
+            conditions = [weather_data.get('condition', 'Clear')]
+            for forecasts in (hourly, daily):
+                conditions.extend(f.get('condition', 'Clear') for f in forecasts.values() if f)
+            self.display.prewarm_icons(conditions)
+
+            self._forecasts = (hourly, daily)
+
+            if hourly and daily:
+                self._weather_ready.set()
+
+            # New data: carousel panels need a full redraw (progress ticks only touch row 31)
+            if self.forecast_mode_active:
+                self.display.refresh_carousel()
+
         # If currently showing weather, refresh display
         if self.last_command and self.last_command.upper() == "WEATHER":
             condition = weather_data.get('condition', 'Clear')
@@ -295,12 +359,8 @@ class LEDMatrixApp:
         elapsed = 0
 
         while elapsed < max_wait and self.running:
-            # Check if we have weather data
-            has_current = self.current_weather is not None
-            has_hourly = len(self.weather_client.get_hourly_forecasts()) > 0 if self.weather_client else False
-            has_daily = len(self.weather_client.get_daily_forecasts()) > 0 if self.weather_client else False
-
-            if has_current and has_hourly and has_daily:
+            # Set by _on_weather_update once current, hourly and daily data are in
+            if self._weather_ready.is_set():
                 logging.info(f"Weather data loaded after {elapsed} seconds")
                 self.display.show_simple_message("Weather", "Loaded!")
                 time.sleep(1)
@@ -310,7 +370,8 @@ class LEDMatrixApp:
             dots = "." * ((elapsed % 4) + 1)
             self.display.show_simple_message("Loading", f"Weather{dots}")
 
-            time.sleep(check_interval)
+            # Wakes as soon as the data arrives instead of finishing the interval
+            self._weather_ready.wait(check_interval)
             elapsed += check_interval
 
         # Timeout or interrupted
@@ -323,12 +384,14 @@ class LEDMatrixApp:
 
     def _main_loop(self):
         """Main application loop"""
-        rest_poll_interval = self.config.rest_poll_interval
+        # Static config read once (Config is never reloaded at runtime)
+        flip_interval = self.config.forecast_flip_interval
+        auto_dimming = self.config.auto_dimming_enabled
 
         while self.running:
             try:
-                # Calculate delta time
-                current_time = time.time()
+                # Calculate delta time (monotonic: immune to RTC/NTP clock steps)
+                current_time = time.monotonic()
                 delta_time = current_time - self.last_loop_time
                 self.last_loop_time = current_time
 
@@ -380,9 +443,9 @@ class LEDMatrixApp:
                         # Normal forecast carousel
                         self.forecast_flip_timer += delta_time
 
-                        # Render carousel with current progress
-                        hourly = self.weather_client.get_hourly_forecasts() if self.weather_client else {}
-                        daily = self.weather_client.get_daily_forecasts() if self.weather_client else {}
+                        # Render carousel with current progress (forecast copies are
+                        # only refreshed by weather updates, not re-fetched every tick)
+                        hourly, daily = self._forecasts
 
                         self.display.show_forecast_carousel(
                             self.current_weather or {},
@@ -392,15 +455,16 @@ class LEDMatrixApp:
                         )
 
                         # Check if time to flip (after displaying full bar)
-                        if self.forecast_flip_timer >= self.config.forecast_flip_interval:
-                            logging.info(f"Flipping forecast view (timer={self.forecast_flip_timer:.1f}s >= interval={self.config.forecast_flip_interval}s)")
+                        if self.forecast_flip_timer >= flip_interval:
+                            logging.info(f"Flipping forecast view (timer={self.forecast_flip_timer:.1f}s >= interval={flip_interval}s)")
                             self.display.flip_carousel_view()
                             self.forecast_flip_timer = 0.0
                         else:
-                            logging.debug(f"Forecast timer: {self.forecast_flip_timer:.1f}s / {self.config.forecast_flip_interval}s")
+                            logging.debug("Forecast timer: %.1fs / %ss", self.forecast_flip_timer, flip_interval)
 
-                # Update day/night mode based on time
-                if self.config.data.get('schedule', {}).get('enable_auto_dimming', True):
+                # Update day/night mode based on time (is_night_time() caches its
+                # answer for Config.NIGHT_CACHE_TTL, so calling it every tick is cheap)
+                if auto_dimming:
                     is_night = self.config.is_night_time()
                     if is_night != self.config._is_night:
                         self.config.set_night_mode(is_night)
@@ -411,8 +475,9 @@ class LEDMatrixApp:
                             condition = self.current_weather.get('condition', 'Clear')
                             self.display.show_weather(self.current_weather, condition)
 
-                # Sleep
-                time.sleep(1)
+                # Sleep until the next tick, or until woken by a command or shutdown
+                self._wake_event.wait(1)
+                self._wake_event.clear()
 
             except KeyboardInterrupt:
                 logging.info("Keyboard interrupt received")
@@ -421,15 +486,19 @@ class LEDMatrixApp:
                 logging.error(f"Error in main loop: {e}", exc_info=True)
                 time.sleep(5)
 
+        if self._stop_signal is not None:
+            logging.info(f"Received signal {self._stop_signal}, shutting down...")
         self.shutdown()
 
     def shutdown(self):
         """Shutdown application"""
-        if not self.running:
+        if self._shutdown_done:
             return
+        self._shutdown_done = True
 
         logging.info("Shutting down application...")
         self.running = False
+        self._wake_event.set()
 
         # Stop components
         if self.aio_client:
@@ -6,12 +6,34 @@ import logging
 import time
 import json
 import requests
-from typing import Optional, Callable, Dict
+from typing import Optional, Callable, Dict, NamedTuple
 from datetime import datetime
 from threading import Thread, Event, Lock
 from dataclasses import dataclass, field
 from functools import lru_cache
 
+from .config import temp_color_index
+
+try:
+    import orjson
+    _loads = orjson.loads  # Rust parser, accepts bytes directly
+except ImportError:
+    _loads = json.loads
+
+
+# Compass direction for each whole degree (8-point rose)
+_WIND_DIRS = ("N", "NE", "E", "SE", "S", "SW", "W", "NW")
+_WIND_LUT = tuple(_WIND_DIRS[round(d / 45) % 8] for d in range(360))
+
+
+class CommonFields(NamedTuple):
+    """Fields shared by current, hourly and daily One Call entries"""
+    condition: str
+    wind_speed: int
+    wind_gust: int
+    humidity: int
+    uvi: float
+
 
 @dataclass
 class WeatherData:
@@ -128,6 +150,9 @@ class DailyForecast:
 class OWMClient:
     """OpenWeatherMap API client with automatic updates and caching"""
 
+    FORECAST_HOURS = (6, 12)  # Hourly forecast offsets shown in the carousel
+    FORECAST_DAYS = 3  # Daily forecasts kept (today + 2)
+
     def __init__(self, config, on_weather_callback: Optional[Callable] = None):
         """
         Initialize OpenWeatherMap client
@@ -260,6 +285,26 @@ class OWMClient:
         # Default fallback
         return "Clear"
 
+    def _common_fields(self, data: dict) -> CommonFields:
+        """
+        Extract the fields every One Call entry shares (current, hourly, daily).
+
+        Args:
+            data: One Call entry dict (imperial units already applied)
+
+        Returns:
+            CommonFields with mapped condition and rounded wind/humidity/UV values
+        """
+        weather = data.get('weather', [{}])[0]
+        # Non-negative quantities: int(x + 0.5) is nearest-int without a round() call
+        return CommonFields(
+            condition=self._map_owm_condition(weather.get('main', 'Clear'), weather.get('id', 800)),
+            wind_speed=int(data.get('wind_speed', 0) + 0.5),
+            wind_gust=int(data.get('wind_gust', 0) + 0.5),
+            humidity=int(data.get('humidity', 0) + 0.5),
+            uvi=round(data.get('uvi', 0), 1)
+        )
+
     def start(self):
         """Start automatic weather updates"""
         if self.running:
@@ -308,10 +353,10 @@ class OWMClient:
                 f"lat={self.lat}&lon={self.lon}&appid={self.api_key}&units=imperial"
             )
 
-            logging.debug(f"Fetching weather from OWM One Call API 3.0")
+            logging.debug("Fetching weather from OWM One Call API 3.0")
             response = requests.get(onecall_url, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = _loads(response.content)
 
             # Process data
             with self.data_lock:
@@ -333,55 +378,33 @@ class OWMClient:
     def _process_current_weather(self, data: dict, timezone_offset: int = 0):
         """Process current weather data from OWM One Call API 3.0"""
         try:
-            # One Call API 3.0 has flatter structure (no 'main' nesting)
-            weather = data.get('weather', [{}])[0]
+            # Condition, wind speed/gust (MPH), humidity and UV index
+            common = self._common_fields(data)
 
             # Extract values (imperial units already applied)
             temp_f = round(data.get('temp', 0))
             feels_f = round(data.get('feels_like', temp_f))
-            humidity = round(data.get('humidity', 0))
             pressure_hpa = data.get('pressure', 1013.25)
-            pressure_inhg = round(pressure_hpa * 0.02953, 2)
-
-            wind_speed_mph = round(data.get('wind_speed', 0))  # Already in MPH with imperial units
+            pressure_inhg = int(pressure_hpa * 2.953 + 0.5) / 100  # hPa -> inHg, 2 decimals
             wind_deg = data.get('wind_deg', 0)
-            wind_gust_mph = round(data.get('wind_gust', 0))  # NEW in One Call API
 
             # NEW fields in One Call API 3.0
-            uvi = round(data.get('uvi', 0), 1)  # UV Index
             dew_point_f = round(data.get('dew_point', 0))
             clouds = data.get('clouds', 0)  # Cloud coverage %
             visibility = data.get('visibility', 10000)  # meters
 
-            # Map OpenWeatherMap condition codes to display icon format
-            owm_condition = weather.get('main', 'Clear')
-            condition_id = weather.get('id', 800)
-            condition = self._map_owm_condition(owm_condition, condition_id)
-
             # Calculate wind direction
-            dirs = ["N", "NE", "E", "SE", "S", "SW", "W", "NW"]
-            wind_dir_str = dirs[round(wind_deg / 45) % 8]
+            wind_dir_str = _WIND_LUT[round(wind_deg) % 360]
 
             # Determine day/night from sunrise/sunset (in current object for One Call API)
-            sunrise = data.get('sunrise', 0)
-            sunset = data.get('sunset', 0)
-            now = time.time()
-            is_night = now < sunrise or now > sunset
-
-            # Temperature color
-            def get_temp_color(t):
-                if t <= 32:
-                    return 4  # Blue
-                if t >= 100:
-                    return 2  # Red
-                progress = (t - 32) / 68.0
-                if progress < 0.4:
-                    return 7  # Cyan
-                if progress <= 0.603:
-                    return 3  # Green
-                if progress < 0.8:
-                    return 5  # Yellow
-                return 8  # Orange
+            sunrise = data.get('sunrise')
+            sunset = data.get('sunset')
+            if sunrise and sunset:
+                now = time.time()
+                is_night = now < sunrise or now > sunset
+            else:
+                # Missing (e.g. polar day/night) - fall back to cached astral calculation
+                is_night = self.config.is_sun_down(self.lat, self.lon)
 
             # Precipitation (from rain/snow data if available)
             rain_1h = data.get('rain', {}).get('1h', 0) if isinstance(data.get('rain'), dict) else 0
@@ -393,19 +416,19 @@ class OWMClient:
             # Store weather data as typed dataclass (convert to dict for backwards compatibility)
             weather_obj = WeatherData(
                 temp=temp_f,
-                temp_color=get_temp_color(temp_f),
+                temp_color=temp_color_index(temp_f),
                 feels_like=feels_f,
-                feels_like_color=get_temp_color(feels_f),
-                wind_speed=wind_speed_mph,
-                wind_gust=wind_gust_mph,
+                feels_like_color=temp_color_index(feels_f),
+                wind_speed=common.wind_speed,
+                wind_gust=common.wind_gust,
                 wind_dir=wind_dir_str,
-                humidity=humidity,
+                humidity=common.humidity,
                 pressure=pressure_inhg,
                 pressure_trend='steady',  # OWM doesn't provide trend
                 is_night=is_night,
-                condition=condition,
+                condition=common.condition,
                 precip_chance=precip_chance,
-                uvi=uvi,
+                uvi=common.uvi,
                 dew_point=dew_point_f,
                 clouds=clouds,
                 visibility=visibility
@@ -413,11 +436,10 @@ class OWMClient:
             # Convert to dict for backwards compatibility with existing display code
             self.weather_data = weather_obj.to_dict()
 
-            # Update day/night mode
+            # Update day/night mode (only on transition)
             was_night = self.config._is_night
-            self.config.set_night_mode(is_night)
-
             if was_night != is_night:
+                self.config.set_night_mode(is_night)
                 logging.info(f"Night mode changed: {was_night} -> {is_night}")
 
         except Exception as e:
@@ -427,43 +449,35 @@ class OWMClient:
         """Process forecast data from OWM One Call API 3.0"""
         try:
             # Process hourly forecasts (48 hours available, use +6h and +12h)
-            if hourly_list and len(hourly_list) >= 12:
-                for hours in [6, 12]:
+            if hourly_list and len(hourly_list) >= self.FORECAST_HOURS[-1]:
+                for hours in self.FORECAST_HOURS:
                     if hours < len(hourly_list):
                         hour_data = hourly_list[hours]
-                        weather = hour_data.get('weather', [{}])[0]
+                        common = self._common_fields(hour_data)
 
                         temp_f = round(hour_data.get('temp', 0))
-                        owm_condition = weather.get('main', 'Clear')
-                        condition_id = weather.get('id', 800)
-                        condition = self._map_owm_condition(owm_condition, condition_id)
                         precip_prob = hour_data.get('pop', 0) * 100  # Probability of precipitation
 
                         # Create typed dataclass (convert to dict for backwards compatibility)
                         hourly_obj = HourlyForecast(
                             temp=temp_f,
-                            condition=condition,
+                            condition=common.condition,
                             time=datetime.fromtimestamp(hour_data['dt']).strftime('%H:%M'),
                             precip_chance=round(precip_prob),
-                            wind_speed=round(hour_data.get('wind_speed', 0)),
-                            wind_gust=round(hour_data.get('wind_gust', 0)),
-                            humidity=round(hour_data.get('humidity', 0)),
-                            uvi=round(hour_data.get('uvi', 0), 1)
+                            wind_speed=common.wind_speed,
+                            wind_gust=common.wind_gust,
+                            humidity=common.humidity,
+                            uvi=common.uvi
                         )
                         self.forecast_hourly[hours] = hourly_obj.to_dict()
 
             # Process daily forecasts (8 days available, use days 0-2)
             if daily_list:
-                for day_offset in range(min(3, len(daily_list))):
+                for day_offset in range(min(self.FORECAST_DAYS, len(daily_list))):
                     day_data = daily_list[day_offset]
-                    weather = day_data.get('weather', [{}])[0]
+                    common = self._common_fields(day_data)
                     temp_obj = day_data.get('temp', {})
 
-                    # Map condition
-                    owm_condition = weather.get('main', 'Clear')
-                    condition_id = weather.get('id', 800)
-                    condition = self._map_owm_condition(owm_condition, condition_id)
-
                     # Extract temperatures (One Call API provides detailed temp breakdown)
                     temp_max = round(temp_obj.get('max', 0))
                     temp_min = round(temp_obj.get('min', 0))
@@ -486,20 +500,20 @@ class OWMClient:
                         temp_night=temp_night,
                         temp_eve=temp_eve,
                         temp_morn=temp_morn,
-                        condition=condition,
+                        condition=common.condition,
                         date=datetime.fromtimestamp(day_data['dt']).strftime('%a %m/%d'),
                         precip_chance=round(precip_prob),
                         summary=summary,
-                        humidity=round(day_data.get('humidity', 0)),
-                        wind_speed=round(day_data.get('wind_speed', 0)),
-                        wind_gust=round(day_data.get('wind_gust', 0)),
-                        uvi=round(day_data.get('uvi', 0), 1),
+                        humidity=common.humidity,
+                        wind_speed=common.wind_speed,
+                        wind_gust=common.wind_gust,
+                        uvi=common.uvi,
                         sunrise=day_data.get('sunrise', 0),
                         sunset=day_data.get('sunset', 0)
                     )
                     self.forecast_daily[day_offset] = daily_obj.to_dict()
 
-            logging.debug(f"Forecast processed: hourly={list(self.forecast_hourly.keys())}, daily={list(self.forecast_daily.keys())}")
+            logging.debug("Forecast processed: hourly=%s, daily=%s", list(self.forecast_hourly), list(self.forecast_daily))
 
         except Exception as e:
             logging.error(f"Error processing forecast: {e}", exc_info=True)
@@ -156,15 +156,12 @@ def calculate_layout(parsed_lines: List[Tuple[int, int, str]], display_height: i
         # Matches CircuitPython display_core.py spacing logic
         size = parsed_lines[0][1]
 
-        # Visual heights for spacing calculations
-        # Sizes 4-7 provide graduated large font options
-        visual_heights = {1: 6, 2: 8, 3: 8, 4: 15, 5: 20, 6: 22, 7: 24}
-
         # Row spacing between lines (matches CircuitPython)
         # Size 3 uses 3px spacing (line 103), sizes 1&2 use 2px (line 111)
         row_spacing = 3 if size == 3 else 2
 
-        visual_height = visual_heights.get(size, 8)
+        # Visual heights for spacing calculations (same table as FONT_SIZES)
+        visual_height = FONT_SIZES.get(size, 8)
 
         # Calculate total content height
         total_text_height = visual_height * num_lines
@@ -213,8 +210,4 @@ def calculate_layout(parsed_lines: List[Tuple[int, int, str]], display_height: i
             positions = [2, 12, 22][:num_lines]
 
     # Combine into output format
-    result = []
-    for (color, size, text), y_pos in zip(parsed_lines, positions):
-        result.append((color, size, y_pos, text))
-
-    return result
+    return [(color, size, y_pos, text) for (color, size, text), y_pos in zip(parsed_lines, positions)]
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""Tests for AIOClient REST poll scheduling and response handling"""
+
+import json
+import math
+import sys
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import aio_client
+from src.aio_client import AIOClient
+
+
+class FakeConfig:
+    """Just the Config accessors AIOClient reads (MQTT off, no network at init)"""
+
+    def __init__(self, daily_budget=0, poll_interval=10, group=None):
+        self.aio_username = "user"
+        self.aio_key = "key"
+        self.aio_feed = "matrixmessage"
+        self.aio_group = group
+        self.mqtt_enabled = False
+        self.rest_enabled = True
+        self.rest_poll_interval = poll_interval
+        self.rest_daily_budget = daily_budget
+
+
+class FrozenDatetime(datetime):
+    """datetime whose now() returns a fixed, settable moment"""
+
+    frozen = datetime(2024, 1, 1, 0, 0, 0)
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls.frozen
+
+
+class FakeResponse:
+    def __init__(self, status_code, body=b"", headers=None):
+        self.status_code = status_code
+        self.content = body
+        self.headers = headers or {}
+
+
+class FakeSession:
+    """Records the headers of each sent request and replays queued responses"""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.sent_headers = []
+
+    def send(self, request, timeout=None):
+        self.sent_headers.append(dict(request.headers))
+        return self.responses.pop(0)
+
+
+class AIOClientTestCase(unittest.TestCase):
+    """Freezes wall-clock and epoch time inside aio_client"""
+
+    NOW = datetime(2024, 1, 1, 0, 0, 0)
+    EPOCH = 1_000_000.0
+
+    def setUp(self):
+        self.set_now(self.NOW)
+        patcher = mock.patch.object(aio_client, "datetime", FrozenDatetime)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.time = mock.Mock()
+        self.time.time.return_value = self.EPOCH
+        patcher = mock.patch.object(aio_client, "time", self.time)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def set_now(self, moment):
+        FrozenDatetime.frozen = FrozenDatetime.combine(moment.date(), moment.time())
+
+    def make_client(self, **config):
+        return AIOClient(FakeConfig(**config))
+
+
+class TestNextPollDelay(AIOClientTestCase):
+
+    def test_no_budget_uses_poll_interval(self):
+        client = self.make_client(daily_budget=0, poll_interval=15)
+        self.assertEqual(client._next_poll_delay(), 15)
+
+    def test_budget_spreads_polls_over_remaining_day(self):
+        client = self.make_client(daily_budget=500)
+        expected = 86400 * (1 - math.exp(-1 / 500))
+        self.assertAlmostEqual(client._next_poll_delay(), expected, places=6)
+
+    def test_never_faster_than_poll_interval(self):
+        self.set_now(datetime(2024, 1, 1, 23, 59, 59))
+        client = self.make_client(daily_budget=500, poll_interval=10)
+        self.assertEqual(client._next_poll_delay(), 10)
+
+    def test_exhausted_budget_waits_until_midnight(self):
+        self.set_now(datetime(2024, 1, 1, 23, 0, 0))
+        client = self.make_client(daily_budget=500)
+        client._budget_day = FrozenDatetime.frozen.date()
+        client._polls_today = 500
+        self.assertEqual(client._next_poll_delay(), 3600)
+
+    def test_day_rollover_resets_poll_count(self):
+        client = self.make_client(daily_budget=500)
+        client._budget_day = datetime(2023, 12, 31).date()
+        client._polls_today = 500
+        expected = 86400 * (1 - math.exp(-1 / 500))
+        self.assertAlmostEqual(client._next_poll_delay(), expected, places=6)
+        self.assertEqual(client._polls_today, 0)
+
+    def test_recent_command_pulls_next_poll_in(self):
+        client = self.make_client(daily_budget=500)
+        scheduled = client._next_poll_delay()
+        client._note_command("BUSY", self.EPOCH)  # age 0 -> maximum pull-in
+        self.assertAlmostEqual(client._next_poll_delay(), scheduled * 0.25, places=6)
+
+
+class TestBurstWindow(AIOClientTestCase):
+
+    def test_default_until_enough_gaps(self):
+        client = self.make_client()
+        for t, command in enumerate(("A", "B", "C", "D")):
+            client._note_command(command, float(t))
+        self.assertEqual(len(client._command_gaps), 3)
+        self.assertEqual(client._burst_window(42.0), 42.0)
+
+    def test_uses_90th_percentile_gap(self):
+        client = self.make_client()
+        client._command_gaps.extend(range(10, 0, -1))
+        self.assertEqual(client._burst_window(42.0), 9)
+
+    def test_repeated_command_is_not_recorded(self):
+        client = self.make_client()
+        client._note_command("BUSY", 0.0)
+        client._note_command("BUSY", 5.0)
+        client._note_command("FREE", 20.0)
+        self.assertEqual(list(client._command_gaps), [20.0])
+        self.assertEqual(client._last_command_time, 20.0)
+
+
+class TestBackoff(AIOClientTestCase):
+
+    def test_error_backoff_not_below_scheduled_delay(self):
+        client = self.make_client(daily_budget=500)
+        client._reset_backoff()
+        scheduled = client._backoff
+        self.assertGreater(scheduled, AIOClient.MAX_REST_BACKOFF)
+        client._increase_backoff()
+        self.assertGreaterEqual(client._backoff, scheduled)
+
+
+class TestExtractCommand(AIOClientTestCase):
+
+    def test_single_feed(self):
+        client = self.make_client()
+        self.assertEqual(client._extract_command({'value': "BUSY"}), "BUSY")
+        self.assertEqual(client._extract_command({}), "")
+
+    def test_group_picks_command_feed(self):
+        client = self.make_client(group="office")
+        data = {'feeds': [
+            {'key': "office.temperature", 'last_value': "71"},
+            {'key': "office.matrixmessage", 'last_value': "FREE"},
+        ]}
+        self.assertEqual(client._extract_command(data), "FREE")
+
+    def test_group_accepts_bare_feed_key(self):
+        client = self.make_client(group="office")
+        data = {'feeds': [{'key': "matrixmessage", 'last_value': "QUIET"}]}
+        self.assertEqual(client._extract_command(data), "QUIET")
+
+    def test_group_without_command_feed(self):
+        client = self.make_client(group="office")
+        data = {'feeds': [{'key': "office.temperature", 'last_value': "71"}]}
+        self.assertEqual(client._extract_command(data), "")
+
+    def test_group_empty_command_value(self):
+        client = self.make_client(group="office")
+        data = {'feeds': [{'key': "office.matrixmessage", 'last_value': None}]}
+        self.assertEqual(client._extract_command(data), "")
+
+
+class TestPollRestApi(AIOClientTestCase):
+
+    def poll(self, client, advance=1000.0):
+        self.time.time.return_value += advance
+        return client.poll_rest_api()
+
+    def test_conditional_get_headers(self):
+        client = self.make_client()
+        client.http = FakeSession([
+            FakeResponse(200, json.dumps({'value': "BUSY"}).encode(),
+                         {"ETag": '"abc"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}),
+            FakeResponse(304),
+            FakeResponse(200, json.dumps({'value': "FREE"}).encode()),
+            FakeResponse(200, json.dumps({'value': "FREE"}).encode()),
+        ])
+
+        self.assertEqual(self.poll(client), {'value': "BUSY", 'source': 'rest'})
+        self.assertNotIn("If-None-Match", client.http.sent_headers[0])
+        self.assertNotIn("If-Modified-Since", client.http.sent_headers[0])
+
+        # Validators from the 200 are sent on the next poll; 304 returns nothing
+        self.assertIsNone(self.poll(client))
+        self.assertEqual(client.http.sent_headers[1]["If-None-Match"], '"abc"')
+        self.assertEqual(client.http.sent_headers[1]["If-Modified-Since"], "Mon, 01 Jan 2024 00:00:00 GMT")
+        self.assertEqual(self.poll(client), {'value': "FREE", 'source': 'rest'})
+
+        # A 200 without validators clears them for the following poll
+        self.assertIsNone(self.poll(client))
+        self.assertNotIn("If-None-Match", client.http.sent_headers[3])
+        self.assertNotIn("If-Modified-Since", client.http.sent_headers[3])
+
+    def test_first_poll_after_midnight_is_counted(self):
+        client = self.make_client(daily_budget=500)
+        client._budget_day = datetime(2023, 12, 31).date()
+        client._polls_today = 499
+        client.http = FakeSession([FakeResponse(304)])
+        self.poll(client)
+        self.assertEqual(client._budget_day, FrozenDatetime.frozen.date())
+        self.assertEqual(client._polls_today, 1)
+
+    def test_skips_poll_inside_interval(self):
+        client = self.make_client()
+        client.http = FakeSession([FakeResponse(304)])
+        self.poll(client)
+        self.assertIsNone(self.poll(client, advance=1.0))
+        self.assertEqual(len(client.http.sent_headers), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()